@@ -16,6 +16,14 @@ class BioRxivFetcher:
         """Parse bioRxiv URL or DOI to extract the DOI."""
         return self.epmc_fetcher.parse_biorxiv_identifier(identifier)
     
+    def search_epmc_for_doi(self, doi: str) -> Optional[str]:
+        """Find the Europe PMC ID for a DOI."""
+        return self.epmc_fetcher.search_epmc_for_doi(doi)
+    
+    def check_full_text_availability(self, epmc_id: str) -> Dict:
+        """Check whether full text XML is available for a Europe PMC ID."""
+        return self.epmc_fetcher.check_full_text_availability(epmc_id)
+    
     def get_paper_metadata(self, doi: str) -> Optional[Dict]:
         """Get paper metadata from Europe PMC."""
         return self.epmc_fetcher.get_paper_metadata(doi)
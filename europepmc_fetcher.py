@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import tempfile
 import xml.etree.ElementTree as ET
 import time
@@ -20,13 +21,27 @@ except ImportError:
     PYEUROPEPMC_AVAILABLE = False
     print("⚠️  pyeuropepmc not available - using manual pagination methods")
 
+# bioRxiv identifier patterns, compiled once for parse_biorxiv_identifier
+BIORXIV_ID_PATTERN = re.compile(r'^\d{4}\.\d{2}\.\d{2}\.\d{6}(v\d+)?$')
+BIORXIV_URL_PATTERNS = (
+    re.compile(r'10\.1101/(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)'),
+    re.compile(r'/content/(?:early/\d{4}/\d{2}/\d{2}/)?(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)'),
+    re.compile(r'/(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)'),
+)
+
 class EuropePMCFetcher:
     """Fetch bioRxiv papers via Europe PMC API"""
     
     BASE_URL = "https://www.ebi.ac.uk/europepmc/webservices/rest"
     
+    # Keep-alive connections kept per host; the web app shares one fetcher across threads
+    HTTP_POOL_SIZE = 20
+    
     def __init__(self):
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.HTTP_POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'KRT-Maker/1.0 (research tool for Key Resource Tables)'
         })
@@ -51,20 +66,14 @@ class EuropePMCFetcher:
             return identifier
         
         # If it's just the ID part, add the DOI prefix
-        if re.match(r'^\d{4}\.\d{2}\.\d{2}\.\d{6}(v\d+)?$', identifier):
+        if BIORXIV_ID_PATTERN.match(identifier):
             return f"10.1101/{identifier}"
         
         # If it's a URL, extract the DOI
         if 'biorxiv.org' in identifier.lower():
             # Try to extract DOI from URL
-            patterns = [
-                r'10\.1101/(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)',
-                r'/content/(?:early/\d{4}/\d{2}/\d{2}/)?(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)',
-                r'/(\d{4}\.\d{2}\.\d{2}\.\d{6}(?:v\d+)?)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, identifier)
+            for pattern in BIORXIV_URL_PATTERNS:
+                match = pattern.search(identifier)
                 if match:
                     return f"10.1101/{match.group(1)}"
         
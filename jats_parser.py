@@ -11,15 +11,18 @@ JATS_NS = {
 }
 
 
+def _make_parser() -> etree.XMLParser:
+    return etree.XMLParser(recover=True, remove_blank_text=True)
+
+
 def parse_xml_string(xml_content: bytes) -> etree._ElementTree:
-    parser = etree.XMLParser(recover=True, remove_blank_text=True)
-    return etree.fromstring(xml_content, parser=parser).getroottree()
+    return etree.fromstring(xml_content, parser=_make_parser()).getroottree()
 
 
 def read_xml(path: str) -> etree._ElementTree:
-    with open(path, "rb") as f:
-        content = f.read()
-    return parse_xml_string(content)
+    # libxml2 reads the file itself in small blocks, so the document is never held
+    # as one Python bytes object next to the tree built from it
+    return etree.parse(path, parser=_make_parser())
 
 
 def extract_plain_text(tree: etree._ElementTree) -> str:
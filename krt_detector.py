@@ -3,10 +3,18 @@ KRT Detection Utility - Detect existing Key Resources Tables in scientific artic
 """
 
 import re
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 import logging
 
+# lxml parses large JATS files much faster than ElementTree; fall back to the stdlib if missing
+try:
+    from lxml import etree as ET
+    # Comments and processing instructions are dropped so element text matches ElementTree's
+    XML_PARSER = ET.XMLParser(huge_tree=True, resolve_entities=False, remove_comments=True, remove_pis=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    XML_PARSER = None
+
 logger = logging.getLogger(__name__)
 
 class KRTDetector:
@@ -127,7 +135,7 @@ class KRTDetector:
             'header': [re.compile(pattern, re.IGNORECASE) for pattern in self.KRT_HEADER_PATTERNS],
         }
     
-    def detect_krt_in_xml(self, xml_content: str) -> Dict:
+    def detect_krt_in_xml(self, xml_content: Union[str, bytes]) -> Dict:
         """
         Detect existing KRT tables in XML content.
         
@@ -138,9 +146,22 @@ class KRTDetector:
             Dictionary with detection results
         """
         try:
-            # Parse XML
-            root = ET.fromstring(xml_content)
+            # Parse XML (lxml rejects str input that carries an encoding declaration)
+            if isinstance(xml_content, str):
+                xml_content = xml_content.encode('utf-8')
+            root = ET.fromstring(xml_content, XML_PARSER)
+            return self._detect_krt_in_root(root)
             
+        except ET.ParseError as e:
+            logger.error(f"XML parsing error: {e}")
+            return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
+        except Exception as e:
+            logger.error(f"Error detecting KRT: {e}")
+            return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
+    
+    def _detect_krt_in_root(self, root: ET.Element) -> Dict:
+        """Detection shared by detect_krt_in_xml and detect_krt_in_file, on a root parsed with XML_PARSER"""
+        try:
             # Find all tables
             tables = self._find_tables(root)
             krt_tables = []
@@ -161,9 +182,6 @@ class KRTDetector:
                 'confidence_score': self._calculate_confidence(krt_tables),
             }
             
-        except ET.ParseError as e:
-            logger.error(f"XML parsing error: {e}")
-            return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
         except Exception as e:
             logger.error(f"Error detecting KRT: {e}")
             return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
@@ -179,12 +197,15 @@ class KRTDetector:
             Dictionary with detection results
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-            return self.detect_krt_in_xml(xml_content)
+            # Parse straight from the file rather than reading it into memory first
+            root = ET.parse(file_path, XML_PARSER).getroot()
+        except ET.ParseError as e:
+            logger.error(f"XML parsing error: {e}")
+            return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
             return {'has_krt': False, 'krt_count': 0, 'krt_tables': [], 'confidence_score': 0}
+        return self._detect_krt_in_root(root)
     
     def _find_tables(self, root: ET.Element) -> List[ET.Element]:
         """Find all table elements in the XML"""
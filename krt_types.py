@@ -11,6 +11,16 @@ KRT_COLUMN_IDENTIFIER = "IDENTIFIER"
 KRT_COLUMN_NEW_OR_REUSE = "NEW/REUSE"
 KRT_COLUMN_ADDITIONAL_INFO = "ADDITIONAL INFORMATION"
 
+# All KRT columns in table order
+KRT_COLUMNS = (
+    KRT_COLUMN_RESOURCE_TYPE,
+    KRT_COLUMN_RESOURCE_NAME,
+    KRT_COLUMN_SOURCE,
+    KRT_COLUMN_IDENTIFIER,
+    KRT_COLUMN_NEW_OR_REUSE,
+    KRT_COLUMN_ADDITIONAL_INFO,
+)
+
 
 AllowedResourceType = Literal[
     "Dataset",
@@ -5,6 +5,7 @@ from django.db.models import Count
 import json
 
 from .models import Article, KRTSession, ProcessedFile, KRTExport, SystemMetrics, XMLFile, AdminKRT
+from .signals import invalidate_admin_krts
 
 
 @admin.register(Article)
@@ -388,15 +389,18 @@ class AdminKRTAdmin(admin.ModelAdmin):
     
     def mark_as_public(self, request, queryset):
         count = queryset.update(is_public=True)
+        invalidate_admin_krts()
         self.message_user(request, f'Successfully made {count} AdminKRT(s) public.')
     mark_as_public.short_description = 'Mark as public'
     
     def mark_as_private(self, request, queryset):
         count = queryset.update(is_public=False)
+        invalidate_admin_krts()
         self.message_user(request, f'Successfully made {count} AdminKRT(s) private.')
     mark_as_private.short_description = 'Mark as private'
     
     def mark_as_featured(self, request, queryset):
         count = queryset.filter(quality_rating__in=['excellent', 'good']).update(is_featured=True)
+        invalidate_admin_krts()
         self.message_user(request, f'Successfully featured {count} high-quality AdminKRT(s).')
     mark_as_featured.short_description = 'Mark as featured (high-quality only)'
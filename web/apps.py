@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class WebConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "web"
+
+    def ready(self):
+        # Register cache invalidation handlers
+        from . import signals  # noqa: F401
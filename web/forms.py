@@ -3,7 +3,8 @@ from django.core.exceptions import ValidationError
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from biorxiv_fetcher import BioRxivFetcher
+
+from .utils import get_fetcher, get_cached_metadata
 
 
 class KRTMakerForm(forms.Form):
@@ -221,8 +222,7 @@ class KRTMakerForm(forms.Form):
             biorxiv_url = biorxiv_url.strip()
             
             # Validate the URL/DOI format
-            fetcher = BioRxivFetcher()
-            doi = fetcher.parse_biorxiv_identifier(biorxiv_url)
+            doi = get_fetcher().parse_biorxiv_identifier(biorxiv_url)
             
             if not doi:
                 raise ValidationError(
@@ -232,7 +232,7 @@ class KRTMakerForm(forms.Form):
             
             # Test if the paper exists
             try:
-                metadata = fetcher.get_paper_metadata(doi)
+                metadata = get_cached_metadata(doi)
                 if not metadata:
                     raise ValidationError(f"Paper not found: {doi}. Please check the URL or DOI and make sure the paper exists on bioRxiv.")
                 
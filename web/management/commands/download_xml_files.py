@@ -275,12 +275,11 @@ class Command(BaseCommand):
             return True
             
         except Exception as e:
-            # Clean up file if database save failed
-            if os.path.exists(full_path):
-                try:
-                    os.unlink(full_path)
-                except:
-                    pass
+            # Clean up file if database save failed (a missing file is fine)
+            try:
+                os.unlink(full_path)
+            except OSError:
+                pass
             return False
 
     def _download_xml_content(self, epmc_id, fetcher):
@@ -182,14 +182,18 @@ class Command(BaseCommand):
         
         if options['dry_run']:
             self.stdout.write("\n🔍 DRY RUN - Papers that would be processed:")
-            for xml_file in papers_to_process:
-                existing = AdminKRT.objects.filter(
-                    doi=xml_file.doi,
+            # Look up existing AdminKRTs for all listed papers in one query
+            existing_status = dict(
+                AdminKRT.objects.filter(
+                    doi__in=[f.doi for f in papers_to_process],
                     provider=provider,
                     model_name=model
-                ).first()
+                ).values_list('doi', 'status')
+            )
+            for xml_file in papers_to_process:
+                existing = existing_status.get(xml_file.doi)
                 
-                status = "NEW" if not existing else f"EXISTS ({existing.status})"
+                status = "NEW" if not existing else f"EXISTS ({existing})"
                 self.stdout.write(f"  📄 {xml_file.doi} - {xml_file.title[:60]}... [{status}]")
             return
         
@@ -30,17 +30,19 @@ class KRTSession(models.Model):
     # File info
     original_filename = models.CharField(max_length=255)
     file_size = models.PositiveIntegerField()
+    # Fingerprint of the file plus extraction settings (see tasks.extraction_job_key)
+    content_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
     
     # Article metadata (enhanced for bioRxiv and other sources)
     input_method = models.CharField(max_length=20, choices=[('upload', 'File Upload'), ('url', 'bioRxiv URL/DOI')], default='upload')
     doi = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     biorxiv_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     epmc_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
-    authors = models.TextField(blank=True, null=True)  # JSON list of authors
+    authors = models.JSONField(blank=True, null=True)  # List of authors
     publication_date = models.DateField(blank=True, null=True)
     journal = models.CharField(max_length=255, blank=True, null=True)
-    keywords = models.TextField(blank=True, null=True)  # JSON list of keywords
-    categories = models.TextField(blank=True, null=True)  # JSON list of categories
+    keywords = models.JSONField(blank=True, null=True)  # List of keywords
+    categories = models.JSONField(blank=True, null=True)  # List of categories
     
     # KRT analysis
     existing_krt_detected = models.BooleanField(default=False)
@@ -62,6 +64,7 @@ class KRTSession(models.Model):
     
     # Status
     STATUS_CHOICES = [
+        ('queued', 'Queued'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
@@ -74,12 +77,23 @@ class KRTSession(models.Model):
     new_resources = models.PositiveIntegerField(default=0)
     reused_resources = models.PositiveIntegerField(default=0)
     
+    # KRT quality (computed once when results are stored, see update_analytics)
+    quality_score = models.PositiveIntegerField(default=0)
+    quality_percentage = models.PositiveIntegerField(default=0)
+    quality_report = models.JSONField(default=dict, blank=True)  # max_score, notes, warnings, suggestions
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['session_id']),
             models.Index(fields=['created_at']),
             models.Index(fields=['status']),
+            # Composite indexes for the article dashboard/profile filters and aggregates
+            models.Index(fields=['status', 'doi']),
+            models.Index(fields=['status', 'mode', 'provider', 'model_name']),
+            models.Index(fields=['doi', '-created_at']),
+            # Profile lookups match doi OR original_filename; both sides need an index
+            models.Index(fields=['original_filename', 'status']),
         ]
     
     def __str__(self):
@@ -92,13 +106,105 @@ class KRTSession(models.Model):
             return (self.resources_found / (self.resources_found + 1)) * 100
         return 0
     
-    def update_analytics(self):
-        """Update analytics based on KRT data"""
-        if self.krt_data:
-            self.resources_found = len(self.krt_data)
-            self.new_resources = len([r for r in self.krt_data if r.get('NEW/REUSE', '').lower() == 'new'])
-            self.reused_resources = len([r for r in self.krt_data if r.get('NEW/REUSE', '').lower() == 'reuse'])
-            self.save(update_fields=['resources_found', 'new_resources', 'reused_resources'])
+    # Resource counters kept in sync with krt_data on every save
+    COUNT_FIELDS = ('resources_found', 'new_resources', 'reused_resources')
+    
+    # Columns written by update_analytics
+    ANALYTICS_FIELDS = COUNT_FIELDS + ('quality_score', 'quality_percentage', 'quality_report')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_krt_data()
+        return instance
+    
+    def _remember_krt_data(self):
+        # Shallow snapshot of the loaded rows, so a full save() can tell whether krt_data changed
+        if 'krt_data' in self.__dict__:  # Absent when the field is deferred
+            krt_data = self.krt_data
+            self._loaded_krt_data = list(krt_data) if isinstance(krt_data, list) else krt_data
+    
+    def _krt_data_changed(self):
+        """True if krt_data was assigned or edited since the row was loaded"""
+        if 'krt_data' not in self.__dict__:
+            return False  # Deferred and never touched
+        if not hasattr(self, '_loaded_krt_data'):
+            return True
+        return self.krt_data != self._loaded_krt_data
+    
+    def save(self, *args, **kwargs):
+        # Summary APIs read the counters instead of loading krt_data, so refresh them
+        # whenever krt_data is written - and only then
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            recount = self._state.adding or self._krt_data_changed()
+        else:
+            recount = 'krt_data' in update_fields
+        if recount:
+            self._update_counts()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *self.COUNT_FIELDS}
+        super().save(*args, **kwargs)
+        if recount:
+            self._remember_krt_data()
+    
+    def _krt_rows(self):
+        """krt_data as a list of row dicts; legacy rows hold it as a JSON string ([] if unreadable)"""
+        rows = self.krt_data
+        if isinstance(rows, str):
+            try:
+                rows = json.loads(rows)
+            except ValueError:
+                return []
+        if not isinstance(rows, list):
+            return []
+        return [row for row in rows if isinstance(row, dict)]
+    
+    def _update_counts(self, rows=None):
+        """Derive the resource counters from krt_data"""
+        if rows is None:
+            rows = self._krt_rows()
+        
+        # One pass over the rows for both new/reuse counters
+        new_count = reuse_count = 0
+        for row in rows:
+            new_reuse = row.get('NEW/REUSE', '').lower()
+            if new_reuse == 'new':
+                new_count += 1
+            elif new_reuse == 'reuse':
+                reuse_count += 1
+        self.resources_found = len(rows)
+        self.new_resources = new_count
+        self.reused_resources = reuse_count
+    
+    def update_analytics(self, save=True):
+        """
+        Update analytics and quality scores based on KRT data.
+        Pass save=False to fold the ANALYTICS_FIELDS into the caller's own save().
+        """
+        rows = self._krt_rows()
+        if rows:
+            self._update_counts(rows)
+        
+        # Run the quality validators once here so the results page only reads columns
+        self.quality_score, self.quality_percentage, self.quality_report = self.compute_quality(rows)
+        if save:
+            self.save(update_fields=list(self.ANALYTICS_FIELDS))
+    
+    @staticmethod
+    def compute_quality(krt_data):
+        """Run the KRT validators; returns (score, percentage, report)"""
+        from krt_validation import validate_krt_completeness, get_krt_quality_score, suggest_krt_improvements
+        
+        score, max_score, notes = get_krt_quality_score(krt_data)
+        report = {
+            'max_score': max_score,
+            'notes': notes,
+            'warnings': validate_krt_completeness(krt_data),
+            'suggestions': suggest_krt_improvements(krt_data),
+        }
+        percentage = int((score / max_score) * 100) if max_score > 0 else 0
+        return score, percentage, report
     
     @property
     def formatted_authors(self):
@@ -153,16 +259,43 @@ class KRTSession(models.Model):
         """Get title for display, with fallback"""
         return self.title or f"Document: {self.original_filename}"
     
+    @staticmethod
+    def cache_key(session_id):
+        """Cache key for the resolved session row (see views.get_session_cached)"""
+        return f"session:{session_id}"
+    
+    @staticmethod
+    def results_cache_key(session_id):
+        """Cache key for the derived ResultsView context of a completed session"""
+        return f"results:{session_id}"
+    
+    @staticmethod
+    def export_cache_key(session_id, format_type, updated_at):
+        """Cache key for a rendered export; versioned by updated_at, so a changed session never hits an old copy"""
+        return f"export:{format_type}:{session_id}:{updated_at.timestamp()}"
+    
+    # Cached ArticleDashboardView context, dropped whenever a session changes (see signals.py)
+    DASHBOARD_CACHE_KEY = 'article_dashboard_ctx'
+    
+    # Cached homepage counters, also dropped whenever a session changes
+    HOME_STATS_CACHE_KEY = 'home_stats'
+    
+    # Cached About page counters, dropped whenever a session or article changes
+    ABOUT_STATS_CACHE_KEY = 'about_stats'
+    
     @classmethod
     def get_by_doi(cls, doi):
         """Get all sessions for a specific DOI"""
         return cls.objects.filter(doi=doi).order_by('-created_at')
     
+    # Large per-session blobs that article listings never render
+    LISTING_DEFERRED_FIELDS = ('krt_data', 'existing_krt_data', 'quality_report', 'extra_instructions', 'error_message')
+    
     @classmethod
     def get_unique_articles(cls):
         """Get unique articles (by DOI or filename)"""
-        # Get all completed sessions
-        sessions = cls.objects.filter(status='completed').order_by('-created_at')
+        # Get all completed sessions, without the KRT rows and other large blobs a listing never shows
+        sessions = cls.objects.filter(status='completed').defer(*cls.LISTING_DEFERRED_FIELDS).order_by('-created_at')
         
         # Group by DOI or filename
         unique_articles = {}
@@ -210,6 +343,7 @@ class XMLFile(models.Model):
     # Paper metadata
     title = models.CharField(max_length=500, blank=True, null=True)
     authors = models.TextField(blank=True, null=True)  # JSON list
+    authors_display = models.CharField(max_length=200, blank=True, default='')  # Precomputed from authors on save
     publication_date = models.DateField(blank=True, null=True)
     journal = models.CharField(max_length=255, default='bioRxiv')
     
@@ -217,6 +351,10 @@ class XMLFile(models.Model):
     is_available = models.BooleanField(default=True)
     error_message = models.TextField(blank=True, null=True)
     
+    # Existing KRT found in the paper, filled in by the first extraction (None = not scanned yet)
+    existing_krt_count = models.PositiveIntegerField(null=True, blank=True)
+    existing_krt_data = models.JSONField(default=list, blank=True)
+    
     class Meta:
         ordering = ['-downloaded_at']
         indexes = [
@@ -224,11 +362,42 @@ class XMLFile(models.Model):
             models.Index(fields=['epmc_id']),
             models.Index(fields=['publication_date']),
             models.Index(fields=['is_available']),
+            # Partial index for the per-year DOI suggestion lookups (available files only)
+            models.Index(
+                fields=['publication_date', 'id'],
+                name='xmlfile_avail_pubdate_idx',
+                condition=models.Q(is_available=True)
+            ),
         ]
     
     def __str__(self):
         return f"XML: {self.doi}"
     
+    def save(self, *args, **kwargs):
+        # Keep the display string in sync so suggestion lists never parse authors JSON
+        if self.authors:
+            self.authors_display = self.format_authors_display(self.authors)
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def format_authors_display(authors):
+        """Short author line ("A, B, C et al.") from the JSON authors list"""
+        if not authors:
+            return "Unknown Authors"
+        try:
+            authors_list = json.loads(authors)
+            if len(authors_list) > 3:
+                display = f"{', '.join(authors_list[:3])} et al."
+            else:
+                display = ', '.join(authors_list)
+        except (ValueError, TypeError):
+            display = authors[:50] + "..." if len(authors) > 50 else authors
+        return display[:200]
+    
+    def get_authors_display(self):
+        """Stored display string, falling back to parsing for rows saved before it existed"""
+        return self.authors_display or self.format_authors_display(self.authors)
+    
     @property
     def full_file_path(self):
         """Get the complete file path including XML storage directory"""
@@ -250,15 +419,14 @@ class XMLFile(models.Model):
     def calculate_file_hash(self):
         """Calculate SHA256 hash of the XML file"""
         import hashlib
-        import os
         
-        if not os.path.exists(self.full_file_path):
-            return None
-            
         hash_sha256 = hashlib.sha256()
-        with open(self.full_file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
+        try:
+            with open(self.full_file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(4096), b""):
+                    hash_sha256.update(chunk)
+        except FileNotFoundError:
+            return None
         return hash_sha256.hexdigest()
 
 
@@ -301,6 +469,9 @@ class Article(models.Model):
     def __str__(self):
         return self.title or f"Article ({self.doi or 'Uploaded file'})"
     
+    # Cached DatabaseManagementView statistics, dropped whenever an article changes (see signals.py)
+    MANAGEMENT_STATS_CACHE_KEY = 'database_management_stats'
+    
     @property
     def best_session(self):
         """Get the session with the most resources found"""
@@ -560,6 +731,9 @@ class AdminKRT(models.Model):
         """Check if this is considered high quality"""
         return self.quality_rating in ['excellent', 'good'] and self.status == 'approved'
     
+    # Cached AdminKRTManagementView context, dropped whenever an admin KRT changes (see signals.py)
+    MANAGEMENT_CACHE_KEY = 'admin_krt_management_ctx'
+    
     @classmethod
     def get_for_doi(cls, doi):
         """Get all admin KRTs for a specific DOI"""
@@ -577,21 +751,30 @@ class AdminKRT(models.Model):
     @classmethod
     def get_pending_generation(cls, limit=10):
         """Get pending KRTs that need to be generated"""
-        return cls.objects.filter(status='pending').order_by('created_at')[:limit]
+        # Single query; the xml_file join saves a lookup per row when the DOI/title is shown
+        return cls.objects.filter(status='pending').select_related('xml_file').order_by('created_at')[:limit]
     
     @classmethod
     def get_statistics(cls):
         """Get statistics about admin KRT generation"""
-        total = cls.objects.count()
-        completed = cls.objects.filter(status='completed').count()
-        approved = cls.objects.filter(status='approved').count()
+        # One aggregate with per-status filtered counts instead of a COUNT query each
+        counts = cls.objects.aggregate(
+            total=models.Count('id'),
+            completed=models.Count('id', filter=models.Q(status='completed')),
+            approved=models.Count('id', filter=models.Q(status='approved')),
+            pending=models.Count('id', filter=models.Q(status='pending')),
+            failed=models.Count('id', filter=models.Q(status='failed')),
+        )
+        total = counts['total']
+        completed = counts['completed']
+        approved = counts['approved']
         
         return {
             'total': total,
             'completed': completed,
             'approved': approved,
-            'pending': cls.objects.filter(status='pending').count(),
-            'failed': cls.objects.filter(status='failed').count(),
+            'pending': counts['pending'],
+            'failed': counts['failed'],
             'completion_rate': (completed / total * 100) if total > 0 else 0,
             'approval_rate': (approved / completed * 100) if completed > 0 else 0,
         }
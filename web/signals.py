@@ -0,0 +1,48 @@
+"""
+Signal handlers for the web application
+
+queryset.update() does not send these signals, so code that updates rows that way
+calls the invalidate_* helpers below itself.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import KRTSession, AdminKRT, Article
+
+
+def invalidate_session(session_id):
+    """Drop the cached copy of a session and the dashboard/home/about stats built from it"""
+    cache.delete_many([
+        KRTSession.cache_key(session_id),
+        KRTSession.results_cache_key(session_id),
+        KRTSession.DASHBOARD_CACHE_KEY,
+        KRTSession.HOME_STATS_CACHE_KEY,
+        KRTSession.ABOUT_STATS_CACHE_KEY,
+    ])
+
+
+def invalidate_admin_krts():
+    """Drop the cached admin KRT management page"""
+    cache.delete(AdminKRT.MANAGEMENT_CACHE_KEY)
+
+
+@receiver(post_save, sender=KRTSession)
+@receiver(post_delete, sender=KRTSession)
+def invalidate_session_cache(sender, instance, **kwargs):
+    """Drop a session's cached data whenever its row changes"""
+    invalidate_session(instance.session_id)
+
+
+@receiver(post_save, sender=AdminKRT)
+@receiver(post_delete, sender=AdminKRT)
+def invalidate_admin_krt_cache(sender, instance, **kwargs):
+    """Drop the cached admin KRT management page whenever an admin KRT changes"""
+    invalidate_admin_krts()
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_stats_cache(sender, instance, **kwargs):
+    """Drop the cached database management and About page statistics whenever an article changes"""
+    cache.delete_many([Article.MANAGEMENT_STATS_CACHE_KEY, KRTSession.ABOUT_STATS_CACHE_KEY])
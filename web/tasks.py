@@ -0,0 +1,353 @@
+"""
+Background tasks for the web application
+
+KRT extraction can take many seconds (LLM round trips), so it runs outside the
+request/response cycle. With KRT_USE_CELERY = True in settings (and Celery installed)
+these are regular Celery tasks, with LLM-heavy work routed to its own queue - see
+VPS_DEPLOYMENT_GUIDE.md for the worker command. Otherwise they run on a daemon thread
+so the site keeps working without a broker.
+"""
+import os
+import sys
+import time
+import hashlib
+import logging
+import threading
+from contextlib import suppress
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import KRTSession, KRTExport, XMLFile
+from .signals import invalidate_session
+
+# Add project root to path so the KRT maker modules import inside workers too
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+try:
+    from celery import shared_task
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Queue for the slow, LLM-bound extraction work
+EXTRACTION_QUEUE = 'krt_extraction'
+
+# Soft limit for one extraction; acks_late re-queues tasks lost with a crashed worker
+EXTRACTION_SOFT_TIME_LIMIT = 25 * 60
+
+# Existing-KRT detection results for uploads, keyed by file content
+KRT_DETECTION_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Block size used when hashing uploads
+HASH_READ_SIZE = 1024 * 1024
+
+# Rough completion (percent) reported by the status endpoint for each extraction stage
+EXTRACTION_PROGRESS = {
+    'queued': 0,
+    'validating': 5,
+    'detecting': 15,
+    'extracting': 30,
+    'saving': 90,
+}
+
+# How long an extraction claims its file/settings fingerprint against double submits
+EXTRACTION_JOB_CACHE_TIMEOUT = 60 * 60
+
+# Sessions that a repeated identical submission is sent to instead of re-running the extraction
+REUSABLE_STATUSES = ('queued', 'processing', 'completed')
+
+# Queued/processing sessions not touched for this long are presumed lost (e.g. a restart
+# killed the thread running them) and are no longer handed to repeated submissions
+STALE_EXTRACTION_AGE = EXTRACTION_SOFT_TIME_LIMIT
+
+# BuildOptions fields that change the extraction result (the API key does not)
+JOB_KEY_OPTIONS = ('mode', 'provider', 'model', 'base_url', 'extra_instructions')
+
+
+def background_task(**options):
+    """Register a function as a Celery task when Celery is available"""
+    def decorator(func):
+        if CELERY_AVAILABLE:
+            return shared_task(**options)(func)
+        return func
+    return decorator
+
+
+def celery_enabled():
+    """True when tasks go through Celery: it must be installed and switched on with KRT_USE_CELERY"""
+    return CELERY_AVAILABLE and getattr(settings, 'KRT_USE_CELERY', False)
+
+
+def dispatch(task, *args):
+    """Run a task in the background - through Celery if enabled, else on a daemon thread"""
+    if celery_enabled():
+        return task.delay(*args)
+
+    def run():
+        try:
+            task(*args)
+        finally:
+            # Threads get their own DB connections; don't leak them
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def progress_cache_key(session_id):
+    """Cache key for the current stage of a running extraction"""
+    return f"krt_progress:{session_id}"
+
+
+def _report_progress(session_id, stage):
+    cache.set(progress_cache_key(session_id), stage, EXTRACTION_SOFT_TIME_LIMIT)
+
+
+def extraction_progress(session_id, status):
+    """
+    Current stage of a session's extraction and its rough completion percentage.
+    Stages live in the cache only, so progress updates never write to the database.
+
+    Returns:
+        Tuple of (stage, percent)
+    """
+    if status in ('completed', 'failed'):
+        return status, 100
+    stage = cache.get(progress_cache_key(session_id)) or status
+    return stage, EXTRACTION_PROGRESS.get(stage, 0)
+
+
+def _api_key_cache_key(session_id):
+    return f"krt_api_key:{session_id}"
+
+
+def stash_api_key(session_id, api_key):
+    """
+    Hand a user-supplied LLM API key to the extraction through the cache, so it never
+    travels in the task arguments (which Celery writes to the broker and result backend).
+    With Celery the cache must be shared with the workers (e.g. Redis).
+    """
+    if api_key:
+        cache.set(_api_key_cache_key(session_id), api_key, EXTRACTION_SOFT_TIME_LIMIT)
+
+
+def _take_api_key(session_id):
+    """The stashed API key for a session (read once), or None to fall back to the provider env vars"""
+    key = _api_key_cache_key(session_id)
+    api_key = cache.get(key)
+    cache.delete(key)
+    return api_key
+
+
+def _reusable_sessions():
+    """Sessions a repeated submission may be sent to: completed ones, and live queued/processing ones"""
+    cutoff = timezone.now() - timedelta(seconds=STALE_EXTRACTION_AGE)
+    return KRTSession.objects.filter(
+        Q(status='completed') | Q(status__in=REUSABLE_STATUSES, updated_at__gte=cutoff)
+    )
+
+
+def file_digest(path):
+    """sha256 hasher fed with the file contents, read in HASH_READ_SIZE blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_READ_SIZE), b''):
+            digest.update(chunk)
+    return digest
+
+
+def extraction_job_key(file_hasher, options):
+    """
+    Fingerprint of an XML file plus the extraction options that affect its result.
+    Takes the file_digest hasher so the file is only read once; the hasher is left untouched.
+    """
+    digest = file_hasher.copy()
+    for name in JOB_KEY_OPTIONS:
+        digest.update(b'\0' + str(options.get(name) or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def claim_extraction(content_hash, session_id):
+    """
+    Claim the extraction of a file/settings fingerprint for a new session.
+
+    Returns:
+        session_id of an earlier queued, running or completed extraction of the same
+        fingerprint to reuse instead, or None if the caller should run its own
+    """
+    key = f"krt:job:{content_hash}"
+    if cache.add(key, session_id, EXTRACTION_JOB_CACHE_TIMEOUT):
+        # Nothing claimed recently; an older identical session may still be in the database
+        existing = _reusable_sessions().filter(
+            content_hash=content_hash
+        ).order_by('-created_at').values_list('session_id', flat=True).first()
+        if existing:
+            cache.set(key, existing, EXTRACTION_JOB_CACHE_TIMEOUT)
+        return existing
+
+    existing = cache.get(key)
+    if existing and _reusable_sessions().filter(session_id=existing).exists():
+        return existing
+
+    # The earlier attempt failed, went stale or is gone - take the claim over
+    cache.set(key, session_id, EXTRACTION_JOB_CACHE_TIMEOUT)
+    return None
+
+
+def detect_existing_krt_cached(xml_path, xml_file=None, file_hash=None):
+    """
+    Detect KRT tables already present in an article, reusing earlier results for the same paper.
+    Results are stored on the XMLFile row for local papers and cached by content hash for uploads
+    (file_hash, when the caller has already hashed the file).
+
+    Returns:
+        Tuple of (krt_count, krt_data formatted for display)
+    """
+    if xml_file is not None and xml_file.existing_krt_count is not None:
+        return xml_file.existing_krt_count, xml_file.existing_krt_data
+
+    cache_key = None
+    if xml_file is None:
+        cache_key = f"krt_detect:{file_hash or file_digest(xml_path).hexdigest()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    from krt_detector import detect_existing_krt, format_krt_data_for_display
+    existing_krt_info = detect_existing_krt(xml_path)
+    result = (
+        existing_krt_info.get('krt_count', 0),
+        format_krt_data_for_display(existing_krt_info.get('krt_tables', [])),
+    )
+
+    if xml_file is not None:
+        XMLFile.objects.filter(pk=xml_file.pk).update(existing_krt_count=result[0], existing_krt_data=result[1])
+    else:
+        cache.set(cache_key, result, KRT_DETECTION_CACHE_TIMEOUT)
+    return result
+
+
+@background_task(queue=EXTRACTION_QUEUE, acks_late=True, soft_time_limit=EXTRACTION_SOFT_TIME_LIMIT)
+def run_krt_extraction(session_id, xml_path, options, biorxiv_metadata=None, cleanup_path=None, xml_file_pk=None,
+                       api_key_stashed=False, file_hash=None):
+    """
+    Validate the XML, detect any KRT already in the paper, then extract the KRT for a
+    queued session and store the results on it.
+
+    Args:
+        session_id: KRTSession.session_id to update
+        xml_path: Path of the JATS XML file to process
+        options: BuildOptions fields as a plain dict (JSON-serializable for the broker). The API
+            key is not among them - it is picked up via stash_api_key, or from the environment
+        biorxiv_metadata: Metadata from local XML storage, preferred over extracted title/abstract
+        cleanup_path: Temp file to delete once processing is done (uploads only)
+        xml_file_pk: XMLFile the paper came from (URL submissions), so detection results are reused
+        api_key_stashed: Whether the submission supplied an API key through stash_api_key
+        file_hash: sha256 hex digest of the XML file, if the submission already computed it
+    """
+    from builder import build_from_xml_path, BuildOptions
+    from validation import validate_xml_file
+
+    biorxiv_metadata = biorxiv_metadata or {}
+
+    try:
+        session = KRTSession.objects.get(session_id=session_id)
+
+        # A key that was supplied but never arrived means the worker doesn't share the web
+        # cache; fail loudly instead of silently extracting without the user's key
+        api_key = _take_api_key(session_id)
+        if api_key_stashed and not api_key:
+            raise ValueError(
+                "The API key could not be handed to the extraction worker. The cache must be "
+                "shared between the web app and the workers (not DummyCache or a per-process "
+                "LocMemCache); please try again."
+            )
+
+        # Only flip the status here so pollers see the task started; everything else is
+        # written in the single UPDATE once extraction finishes
+        KRTSession.objects.filter(pk=session.pk).update(status='processing', updated_at=timezone.now())
+        invalidate_session(session_id)
+
+        _report_progress(session_id, 'validating')
+        validate_xml_file(xml_path)
+
+        # Detect existing KRT in the article (reuses earlier results for the same paper)
+        _report_progress(session_id, 'detecting')
+        try:
+            xml_file = XMLFile.objects.filter(pk=xml_file_pk).first() if xml_file_pk else None
+            existing_krt_count, existing_krt_data = detect_existing_krt_cached(xml_path, xml_file, file_hash)
+        except Exception as e:
+            logger.warning(f"KRT detection failed for session {session_id}: {e}")
+            existing_krt_count, existing_krt_data = 0, []
+
+        # Record start time
+        start_time = time.time()
+
+        # Extract KRT
+        _report_progress(session_id, 'extracting')
+        result = build_from_xml_path(xml_path, BuildOptions(**options, api_key=api_key))
+
+        # Record processing time
+        processing_time = time.time() - start_time
+
+        # Update session with results
+        _report_progress(session_id, 'saving')
+        session.status = 'completed'
+        # Use bioRxiv metadata title if available, otherwise use extracted title
+        session.title = biorxiv_metadata.get('title') or result.get('title', '')
+        # Use bioRxiv metadata abstract if available, otherwise use extracted abstract
+        session.abstract = biorxiv_metadata.get('abstract') or result.get('abstract', '')
+        session.krt_data = result.get('rows', [])
+        session.processing_time = processing_time
+        session.existing_krt_detected = existing_krt_count > 0
+        session.existing_krt_count = existing_krt_count
+        session.existing_krt_data = existing_krt_data
+
+        # Update analytics and write everything in a single UPDATE
+        session.update_analytics(save=False)
+        session.save(update_fields=[
+            'status', 'title', 'abstract', 'krt_data', 'processing_time', 'updated_at',
+            'existing_krt_detected', 'existing_krt_count', 'existing_krt_data',
+            *KRTSession.ANALYTICS_FIELDS,
+        ])
+
+        logger.info(f"KRT extraction for session {session_id} found {session.resources_found} resources in {processing_time:.1f}s")
+
+    except Exception as e:
+        logger.exception(f"KRT extraction failed for session {session_id}")
+        KRTSession.objects.filter(session_id=session_id).update(status='failed', error_message=str(e))
+        invalidate_session(session_id)
+
+    finally:
+        cache.delete(progress_cache_key(session_id))
+
+        # Clean up temporary uploaded XML file
+        if cleanup_path:
+            with suppress(OSError):
+                os.unlink(cleanup_path)
+
+
+@background_task()
+def record_export(session_pk, format_type, ip_address, user_agent):
+    """Log a KRT download for analytics"""
+    KRTExport.objects.create(session_id=session_pk, format=format_type, ip_address=ip_address, user_agent=user_agent)
+
+
+def log_export(session_pk, format_type, ip_address, user_agent):
+    """
+    Log a KRT download - queued on Celery when it is enabled, otherwise written right away.
+    A single INSERT is cheaper than starting a thread (and DB connection) per download.
+    """
+    args = (session_pk, format_type, ip_address, user_agent)
+    if celery_enabled():
+        record_export.delay(*args)
+    else:
+        record_export(*args)
@@ -42,7 +42,7 @@ urlpatterns = [
     # path('feedback/<str:session_id>/', views.FeedbackView.as_view(), name='feedback_session'),  # TODO: Implement FeedbackView
     
     # API endpoints
-    # path('api/status/<str:session_id>/', views.api_status, name='api_status'),  # TODO: Implement api_status
+    path('api/status/<str:session_id>/', views.api_status, name='api_status'),
     
     # AI Enhancement Features
     path('ai/', views_ai_enhancement.AIFeaturesView.as_view(), name='ai_features'),
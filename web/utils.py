@@ -1,6 +1,50 @@
 """
 Utility functions for the web application
 """
+from django.core.cache import cache
+
+# Preprint metadata hardly changes once posted, so keep it for a week
+METADATA_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+_fetcher = None
+
+
+def get_fetcher():
+    """Process-wide BioRxivFetcher, so its HTTP session is reused across requests"""
+    global _fetcher
+    if _fetcher is None:
+        from biorxiv_fetcher import BioRxivFetcher
+        _fetcher = BioRxivFetcher()
+    return _fetcher
+
+
+def get_cached_metadata(doi):
+    """
+    Europe PMC metadata for a bioRxiv DOI, cached by DOI.
+    Returns {} if the paper is not found (not cached, so newly indexed papers show up).
+    """
+    key = f"biorxiv:meta:{doi}"
+    metadata = cache.get(key)
+    if metadata is None:
+        metadata = get_fetcher().get_paper_metadata(doi) or {}
+        if metadata:
+            cache.set(key, metadata, METADATA_CACHE_TIMEOUT)
+    return metadata
+
+
+def get_cached_epmc_id(doi):
+    """
+    Europe PMC ID for a bioRxiv DOI, cached by DOI (IDs never change once assigned).
+    Returns None if the paper is not indexed yet (not cached, so it is found once it is).
+    """
+    key = f"biorxiv:epmc_id:{doi}"
+    epmc_id = cache.get(key)
+    if epmc_id is None:
+        epmc_id = get_fetcher().search_epmc_for_doi(doi)
+        if epmc_id:
+            cache.set(key, epmc_id, METADATA_CACHE_TIMEOUT)
+    return epmc_id
+
 
 def validate_model_choices_sync():
     """
@@ -1,24 +1,43 @@
+import io
 import os
+import csv
 import json
 import uuid
-import time
+import shutil
+import random
+import logging
 import tempfile
-from datetime import datetime, timedelta
+import functools
+from operator import itemgetter
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from statistics import fmean
 
-from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse, HttpResponse, Http404
+from django.shortcuts import render, redirect
+from django.http import JsonResponse, HttpResponse, Http404, StreamingHttpResponse, FileResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import require_http_methods, condition
+from django.views.decorators.gzip import gzip_page
 from django.contrib import messages
-from django.core.files.storage import default_storage
 from django.utils.decorators import method_decorator
+from django.utils.cache import patch_cache_control
 from django.views.generic import FormView, TemplateView
-from django.db.models import Count, Avg, Sum, Q
-from django.db import models
+from django.db.models import Count, Avg, Sum, Min, Max, Q, Subquery, Value, Window
+from django.db.models.functions import Coalesce, ExtractYear, NullIf
+from django.db import transaction
+from django.urls import reverse
 from django.utils import timezone
+from django.core.cache import cache
 
 from .forms import KRTMakerForm, FeedbackForm
-from .models import KRTSession, ProcessedFile, KRTExport, SystemMetrics, Article, XMLFile, AdminKRT
+from .models import KRTSession, KRTExport, SystemMetrics, Article, XMLFile, AdminKRT
+from .tasks import (
+    dispatch, run_krt_extraction, log_export, file_digest, extraction_job_key, claim_extraction,
+    extraction_progress, stash_api_key,
+)
+from .signals import invalidate_session
+from .utils import get_fetcher, get_cached_metadata, get_cached_epmc_id
 
 # Import the KRT maker functionality (using project root path)
 from django.conf import settings
@@ -30,30 +49,170 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from builder import build_from_xml_path, BuildOptions
-from validation import validate_xml_file, validate_api_config, ValidationError as KRTValidationError
-from biorxiv_fetcher import BioRxivFetcher
-from krt_validation import validate_krt_completeness, get_krt_quality_score, suggest_krt_improvements
+# Only the lightweight validation helpers are needed here; builder (and the LLM client
+# libraries it pulls in) is imported by the extraction task in the worker
+from validation import validate_api_config, ValidationError as KRTValidationError
+from krt_types import KRT_COLUMNS
+
+# orjson serializes the large krt_data payloads several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# openpyxl is optional (Excel export only); resolved once here rather than on every export
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+    OPENPYXL_AVAILABLE = True
+    
+    # Excel export styles, built once and shared by every export
+    EXCEL_TITLE_FONT = Font(bold=True, size=14)
+    EXCEL_HEADER_FONT = Font(bold=True)
+    EXCEL_HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Shared fetcher for DOI parsing and Europe PMC lookups (avoids re-creating its HTTP session per request)
+_fetcher = get_fetcher()
+
+# Worker threads for Europe PMC lookups that can overlap within a single request
+_lookup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='epmc-lookup')
+
+# Europe PMC availability answers for a DOI, shared across users typing the same DOI.
+# Full text that is available stays available; a missing one is re-checked sooner so
+# newly indexed papers show up quickly
+EPMC_LOOKUP_CACHE_TIMEOUT = 60 * 60
+EPMC_UNAVAILABLE_CACHE_TIMEOUT = 5 * 60
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_doi_cached(identifier):
+    """Parse a bioRxiv URL/DOI through a process-wide LRU cache - the inputs are short, immutable strings"""
+    return _fetcher.parse_biorxiv_identifier(identifier)
+
+
+def json_response(data, status=200, indent=False):
+    """JsonResponse equivalent that serializes with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return HttpResponse(orjson.dumps(data, option=option), content_type='application/json', status=status)
+    return JsonResponse(data, status=status, json_dumps_params={'indent': 2} if indent else None)
+
+
+def json_loads(body):
+    """json.loads that parses with orjson when it is installed (its JSONDecodeError subclasses json's)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+# Model choices per provider for the maker page JavaScript; these are class
+# attributes, so there is no need to build a form instance per request
+MODEL_CHOICES = {
+    'anthropic': KRTMakerForm.ANTHROPIC_MODELS,
+    'gemini': KRTMakerForm.GEMINI_MODELS,
+    'openai_compatible': KRTMakerForm.OPENAI_COMPATIBLE_MODELS,
+}
+
+# Block size used when copying uploads into the extraction temp file
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Completed sessions are effectively immutable, so they can be cached for a long time.
+# Entries are dropped by the post_save/post_delete handlers in signals.py.
+SESSION_CACHE_TIMEOUT = 60 * 60
+
+
+def get_session_cached(session_id):
+    """
+    Resolve a KRTSession by session_id, serving completed sessions from the cache.
+    Returns None if the session does not exist.
+    """
+    if not session_id:
+        return None
+    
+    key = KRTSession.cache_key(session_id)
+    session = cache.get(key)
+    if session is None:
+        session = KRTSession.objects.filter(session_id=session_id).first()
+        # Only cache finished sessions - in-flight ones still change status
+        if session is not None and session.status == 'completed':
+            cache.set(key, session, SESSION_CACHE_TIMEOUT)
+    return session
+
+
+def get_krt_rows(session):
+    """
+    KRT rows of a session as a list. Older rows may hold the JSON as a string; those are
+    parsed once per session version and cached. Raises json.JSONDecodeError if malformed.
+    """
+    krt_data = session.krt_data
+    if not krt_data:
+        return []
+    if isinstance(krt_data, list):
+        return krt_data
+    if not isinstance(krt_data, str):
+        return []
+    
+    key = f"krt:{session.session_id}:{session.updated_at.timestamp()}"
+    rows = cache.get(key)
+    if rows is None:
+        rows = json.loads(krt_data)
+        cache.set(key, rows, SESSION_CACHE_TIMEOUT)
+    return rows
+
+
+# Availability checks are polled while the user types a DOI; remember recent "file is
+# there" answers briefly instead of hitting the filesystem on every keystroke
+FILE_EXISTS_CACHE_TIMEOUT = 60
+
+
+def xml_file_exists_cached(xml_file):
+    """xml_file.verify_file_exists() with positive results cached (keyed on the row version)"""
+    key = f"xmlexists:{xml_file.pk}:{xml_file.last_checked.timestamp()}"
+    if cache.get(key):
+        return True
+    exists = xml_file.verify_file_exists()
+    if exists:
+        cache.set(key, True, FILE_EXISTS_CACHE_TIMEOUT)
+    return exists
+
+
+def _compute_home_stats():
+    """Homepage counters in a single aggregate query"""
+    stats = KRTSession.objects.aggregate(
+        total=Count('id'),
+        successful=Count('id', filter=Q(status='completed')),
+        resources=Sum('resources_found'),
+    )
+    total_sessions = stats['total']
+    successful_sessions = stats['successful']
+    
+    return {
+        'total_sessions': total_sessions,
+        'successful_sessions': successful_sessions,
+        'total_resources': stats['resources'] or 0,
+        'success_rate': round((successful_sessions / total_sessions * 100) if total_sessions > 0 else 0, 1),
+    }
 
 
 class HomeView(TemplateView):
     """Beautiful homepage with features and getting started info"""
     template_name = 'web/home.html'
     
+    # The homepage counters change slowly; a short TTL keeps them fresh enough
+    STATS_CACHE_TIMEOUT = 60
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Get some basic stats for the homepage
-        total_sessions = KRTSession.objects.count()
-        successful_sessions = KRTSession.objects.filter(status='completed').count()
-        total_resources = KRTSession.objects.aggregate(Sum('resources_found'))['resources_found__sum'] or 0
-        
-        context.update({
-            'total_sessions': total_sessions,
-            'successful_sessions': successful_sessions,
-            'total_resources': total_resources,
-            'success_rate': round((successful_sessions / total_sessions * 100) if total_sessions > 0 else 0, 1),
-        })
+        context.update(cache.get_or_set(KRTSession.HOME_STATS_CACHE_KEY, _compute_home_stats, self.STATS_CACHE_TIMEOUT))
         
         return context
 
@@ -68,16 +227,48 @@ class KRTMakerView(FormView):
         context = super().get_context_data(**kwargs)
         
         # Add model choices for JavaScript - ensures Django and JS stay synchronized
-        from .forms import KRTMakerForm
-        form = KRTMakerForm()
-        context['model_choices'] = {
-            'anthropic': form.ANTHROPIC_MODELS,
-            'gemini': form.GEMINI_MODELS,
-            'openai_compatible': form.OPENAI_COMPATIBLE_MODELS,
-        }
+        context['model_choices'] = MODEL_CHOICES
         
         return context
     
+    def _wants_json(self):
+        """True for AJAX/API submissions that expect a JSON reply instead of a page"""
+        request = self.request
+        if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+            return True
+        # Browsers send */* as well, so require that HTML is not acceptable
+        return request.accepts('application/json') and not request.accepts('text/html')
+    
+    def _fail_session(self, form, session, exc, tag):
+        """Mark the session as failed (if one was created) and build the error response"""
+        if session:
+            # Single UPDATE of the two changed columns instead of a full-row save()
+            KRTSession.objects.filter(pk=session.pk).update(status='failed', error_message=str(exc))
+            invalidate_session(session.session_id)
+        
+        # API/AJAX callers never see flash messages - skip building them
+        if self._wants_json():
+            return JsonResponse({'error': str(exc)}, status=400)
+        
+        messages.error(self.request, f'{tag}: {exc}')
+        return self.form_invalid(form)
+    
+    def _submitted_response(self, session_id, status, message):
+        """Point the client at a queued (or reused) session: 202 JSON for API callers, else a redirect"""
+        status_url = reverse('web:api_status', args=[session_id])
+        results_url = reverse('web:results', args=[session_id])
+        
+        if self._wants_json():
+            return JsonResponse({
+                'session_id': session_id,
+                'status': status,
+                'status_url': status_url,
+                'results_url': results_url,
+            }, status=202)
+        
+        messages.info(self.request, message)
+        return redirect(results_url)
+    
     def form_valid(self, form):
         """Process the form and extract KRT"""
         # Generate unique session ID
@@ -99,11 +290,16 @@ class KRTMakerView(FormView):
         original_filename = "unknown.xml"
         file_size = 0
         temp_xml_path = None  # For cleanup if downloaded
-        temp_path = None  # For Django file storage cleanup (uploads only)
+        session_doi = None  # bioRxiv DOI for URL submissions
         session = None  # Initialize session variable for exception handling
         local_xml_file = None  # Initialize local_xml_file for local storage reference
         
         try:
+            # Validate LLM configuration first - it is a cheap local check (env vars only, no
+            # provider round trip), so a bad config fails before any file or session is written
+            if mode == 'llm':
+                validate_api_config(provider or "openai", api_key, model)
+            
             if input_method == 'upload' and xml_file:
                 # File upload method
                 original_filename = xml_file.name
@@ -117,23 +313,31 @@ class KRTMakerView(FormView):
                     delete=False,
                     dir=tempfile.gettempdir()  # Use system temp directory
                 )
+                xml_path = temp_file.name
                 
-                # Copy uploaded file content to temp file
-                for chunk in xml_file.chunks():
-                    temp_file.write(chunk)
-                temp_file.close()
+                if hasattr(xml_file, 'temporary_file_path'):
+                    # Large uploads are already on disk (TemporaryUploadedFile) - rename, don't copy
+                    temp_file.close()
+                    try:
+                        os.replace(xml_file.temporary_file_path(), xml_path)
+                    except OSError:
+                        # Upload temp dir is on another filesystem - fall back to a buffered copy
+                        xml_file.seek(0)
+                        with open(xml_path, 'wb') as dest:
+                            shutil.copyfileobj(xml_file, dest, length=UPLOAD_COPY_BUFFER_SIZE)
+                else:
+                    # Copy uploaded file content to temp file in large fixed-size blocks
+                    xml_file.seek(0)
+                    shutil.copyfileobj(xml_file, temp_file, length=UPLOAD_COPY_BUFFER_SIZE)
+                    temp_file.close()
                 
-                xml_path = temp_file.name
                 temp_xml_path = xml_path  # For cleanup via finally block
                 # Note: For uploads, we don't use Django's default_storage since 
                 # we're saving to system temp directory to avoid auto-reload issues
                 
             elif input_method == 'url' and biorxiv_url:
-                # bioRxiv URL method
-                fetcher = BioRxivFetcher()
-                
-                # Parse DOI from URL
-                doi = fetcher.parse_biorxiv_identifier(biorxiv_url)
+                # bioRxiv URL method - parse the DOI once (memoized) and reuse it below
+                doi = session_doi = parse_doi_cached(biorxiv_url)
                 if not doi:
                     raise ValueError("Invalid bioRxiv URL or DOI")
                 
@@ -160,309 +364,292 @@ class KRTMakerView(FormView):
             else:
                 raise ValueError("No valid input method provided")
             
+            # BuildOptions fields for KRT extraction, as a plain dict for the task. The API key
+            # is left out so it never reaches the task broker (see stash_api_key)
+            options = dict(
+                mode='llm' if mode == 'llm' else 'regex',
+                provider=provider,
+                model=model,
+                base_url=base_url,
+                extra_instructions=extra_instructions,
+            )
+            
+            # A repeated submission of the same file with the same settings (e.g. a double
+            # click) is sent to the existing session instead of paying for another extraction
+            file_hasher = file_digest(xml_path)
+            content_hash = extraction_job_key(file_hasher, options)
+            existing_session_id = claim_extraction(content_hash, session_id)
+            if existing_session_id:
+                existing_status = KRTSession.objects.filter(
+                    session_id=existing_session_id
+                ).values_list('status', flat=True).first()
+                return self._submitted_response(
+                    existing_session_id, existing_status,
+                    'This file has already been submitted with the same settings.',
+                )
+            
             # Get bioRxiv metadata if available
             biorxiv_metadata = {}
-            session_doi = None
-            if input_method == 'url' and biorxiv_url:
-                fetcher = BioRxivFetcher()
-                session_doi = fetcher.parse_biorxiv_identifier(biorxiv_url)
-                if session_doi and local_xml_file:
-                    # Use metadata from local XML file record
-                    biorxiv_metadata = {
-                        'doi': local_xml_file.doi,
-                        'title': local_xml_file.title,
-                        'authors': local_xml_file.authors,  # This is already JSON string
-                        'authors_detailed': json.loads(local_xml_file.authors) if local_xml_file.authors else [],
-                        'publication_date': local_xml_file.publication_date.strftime('%Y-%m-%d') if local_xml_file.publication_date else None,
-                        'abstract': None,  # Abstract not stored in XMLFile model - will be extracted from XML
-                        'journal': local_xml_file.journal,
-                        'keywords': None,  # Keywords not stored in XMLFile model
-                        'pmcid': None,
-                        'pmid': None,
-                        'source': 'local_xml_storage'
-                    }
-            
-            # Parse authors - handle both list and string formats
-            authors_list = []
-            if biorxiv_metadata.get('authors_detailed'):
-                # Use detailed author list if available
-                authors_list = biorxiv_metadata['authors_detailed']
-            elif biorxiv_metadata.get('authors'):
-                # Handle both list and comma-separated string formats
-                authors_data = biorxiv_metadata['authors']
-                if isinstance(authors_data, list):
-                    authors_list = authors_data
-                elif isinstance(authors_data, str):
-                    authors_list = [author.strip() for author in authors_data.split(',')]
-                
-            # Parse publication date if available  
+            authors = None
             pub_date = None
-            if biorxiv_metadata.get('publication_date'):
-                try:
-                    from datetime import datetime
-                    date_str = biorxiv_metadata['publication_date']
-                    # Europe PMC returns dates in YYYY-MM-DD format
-                    pub_date = datetime.strptime(date_str[:10], '%Y-%m-%d').date()
-                except (ValueError, TypeError):
-                    pub_date = None
+            if session_doi and local_xml_file:
+                # XMLFile.authors holds JSON text; the session's JSONField stores the decoded list
+                if local_xml_file.authors:
+                    try:
+                        authors = json.loads(local_xml_file.authors)
+                    except ValueError:
+                        authors = local_xml_file.authors  # Legacy plain-text author line
+                
+                # Use metadata from local XML file record
+                biorxiv_metadata = {
+                    'doi': local_xml_file.doi,
+                    'title': local_xml_file.title,
+                    'publication_date': local_xml_file.publication_date.strftime('%Y-%m-%d') if local_xml_file.publication_date else None,
+                    'abstract': None,  # Abstract not stored in XMLFile model - will be extracted from XML
+                    'journal': local_xml_file.journal,
+                    'keywords': None,  # Keywords not stored in XMLFile model
+                    'pmcid': None,
+                    'pmid': None,
+                    'source': 'local_xml_storage'
+                }
+                # Already a date on the record - no need to round-trip the string above
+                pub_date = local_xml_file.publication_date
             
             # Create session record
             session = KRTSession.objects.create(
                 session_id=session_id,
                 original_filename=original_filename,
                 file_size=file_size,
+                content_hash=content_hash,
                 input_method=input_method,
                 doi=biorxiv_metadata.get('doi') or session_doi,
                 biorxiv_id=session_doi,  # Store the bioRxiv ID
                 epmc_id=None,  # Will be populated when we get EPMC ID
-                authors=json.dumps(authors_list) if authors_list else None,
+                authors=authors,
                 publication_date=pub_date,
                 journal=biorxiv_metadata.get('journal', 'bioRxiv'),
-                keywords=json.dumps(biorxiv_metadata.get('keywords', [])) if biorxiv_metadata.get('keywords') else None,
+                keywords=biorxiv_metadata.get('keywords') or None,
                 categories=None,  # Categories not available from Europe PMC
                 mode=mode,
                 provider=provider,
                 model_name=model,
                 base_url=base_url,
                 extra_instructions=extra_instructions,
-                status='processing'
+                status='queued'
             )
             
-            # Note: No ProcessedFile record needed since we use system temp files
-            # This avoids Django auto-reload issues from file monitoring
-            
-            # Validate XML file
-            validate_xml_file(xml_path)
-            
-            # Detect existing KRT in the article (import only when needed to avoid auto-reload)
-            try:
-                from krt_detector import detect_existing_krt, format_krt_data_for_display
-                existing_krt_info = detect_existing_krt(xml_path)
-                existing_krt_data = format_krt_data_for_display(existing_krt_info.get('krt_tables', []))
-                
-                # Update session with existing KRT info
-                session.existing_krt_detected = existing_krt_info.get('has_krt', False)
-                session.existing_krt_count = existing_krt_info.get('krt_count', 0)
-                session.existing_krt_data = existing_krt_data
-            except Exception as e:
-                print(f"KRT detection failed: {e}")
-                # Set default values if KRT detection fails
-                session.existing_krt_detected = False
-                session.existing_krt_count = 0
-                session.existing_krt_data = []
+            # Note: No ProcessedFile record is created - the upload only lives in a system
+            # temp file for the duration of the extraction, and the session already keeps
+            # original_filename/file_size for auditing. This also avoids Django auto-reload
+            # issues from file monitoring.
             
-            session.save()
-            
-            # Build options for KRT extraction
-            options = BuildOptions(
-                mode='llm' if mode == 'llm' else 'regex',
-                provider=provider,
-                model=model,
-                base_url=base_url,
-                api_key=api_key,
-                extra_instructions=extra_instructions,
+            # Hand the slow extraction off to a background worker once the session row is
+            # committed; the worker owns (and cleans up) the temp upload from here on
+            task_args = (
+                session_id, xml_path, options, biorxiv_metadata, temp_xml_path,
+                local_xml_file.pk if local_xml_file else None, bool(api_key), file_hasher.hexdigest(),
             )
+            stash_api_key(session_id, api_key)
+            transaction.on_commit(lambda: dispatch(run_krt_extraction, *task_args))
+            temp_xml_path = None
             
-            # Validate LLM configuration if needed
-            if mode == 'llm':
-                validate_api_config(provider or "openai", api_key, model)
-            
-            # Record start time
-            start_time = time.time()
-            
-            # Extract KRT
-            result = build_from_xml_path(xml_path, options)
-            
-            # Record processing time
-            processing_time = time.time() - start_time
-            
-            # Update session with results
-            session.status = 'completed'
-            # Use bioRxiv metadata title if available, otherwise use extracted title
-            session.title = biorxiv_metadata.get('title') or result.get('title', '')
-            # Use bioRxiv metadata abstract if available, otherwise use extracted abstract
-            session.abstract = biorxiv_metadata.get('abstract') or result.get('abstract', '')
-            session.krt_data = result.get('rows', [])
-            session.processing_time = processing_time
-            session.save()
-            
-            # Update analytics
-            session.update_analytics()
-            
-            # Note: Temp files cleaned up in finally block below
-            
-            messages.success(
-                self.request, 
-                f'KRT extraction completed successfully! Found {len(result.get("rows", []))} resources in {processing_time:.1f} seconds.'
+            return self._submitted_response(
+                session_id, session.status, 'KRT extraction started. This page will update when it finishes.'
             )
             
-            # Redirect to article profile instead of results page
-            if session.doi:
-                return redirect('web:article_profile', identifier=session.doi)
-            else:
-                return redirect('web:article_profile', identifier=session_id)
-            
         except KRTValidationError as e:
-            if session:
-                session.status = 'failed'
-                session.error_message = str(e)
-                session.save()
-            
-            messages.error(self.request, f'Validation error: {e}')
-            return self.form_invalid(form)
+            return self._fail_session(form, session, e, 'Validation error')
             
         except Exception as e:
-            if session:
-                session.status = 'failed'
-                session.error_message = str(e)
-                session.save()
-            
-            messages.error(self.request, f'Processing error: {e}')
-            return self.form_invalid(form)
+            # Also covers URL preflight errors raised before any session row exists
+            return self._fail_session(form, session, e, 'Processing error')
             
         finally:
-            # Clean up temporary bioRxiv XML file
-            if temp_xml_path and os.path.exists(temp_xml_path):
-                try:
+            # Clean up the temporary upload if it was not handed to the extraction task
+            # (best effort - no exists() check first, a missing file is fine)
+            if temp_xml_path:
+                with suppress(OSError):
                     os.unlink(temp_xml_path)
-                except Exception:
-                    pass  # Ignore cleanup errors
 
 
+def _has_pending_messages(request):
+    """True if flash messages are waiting to be shown (checking does not consume them)"""
+    return len(messages.get_messages(request)) > 0
+
+
+def results_etag(request, session_id):
+    """ETag for ResultsView; completed sessions come from the session cache, so a 304 needs no query"""
+    if _has_pending_messages(request):
+        # The page carries one-shot messages - it must be rendered, not answered with a 304
+        return None
+    session = get_session_cached(session_id)
+    return _session_etag(session_id, session.updated_at, session.status) if session else None
+
+
+@method_decorator(gzip_page, name='dispatch')
+@method_decorator(condition(etag_func=results_etag), name='dispatch')
 class ResultsView(TemplateView):
     """Display KRT extraction results"""
     template_name = 'web/results.html'
     
+    # Browsers may reuse a completed session's page for this long without revalidating
+    COMPLETED_MAX_AGE = 60 * 60
+    
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        session = context.get('session')
+        if _has_pending_messages(self.request):
+            # One-shot messages (e.g. "already submitted") must not be replayed from the browser cache
+            patch_cache_control(response, no_store=True)
+        elif session is not None and session.status == 'completed':
+            patch_cache_control(response, private=True, max_age=self.COMPLETED_MAX_AGE, must_revalidate=True)
+        else:
+            # Queued/processing pages change as the extraction runs
+            patch_cache_control(response, no_store=True)
+        return response
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         session_id = kwargs.get('session_id')
         
         try:
-            session = get_object_or_404(KRTSession, session_id=session_id)
+            session = get_session_cached(session_id)
+            if session is None:
+                raise Http404('Session not found')
             context['session'] = session
             
             if session.status == 'completed':
-                # Process KRT data for display
-                krt_data = session.krt_data or []
-                
-                # Group by resource type for better visualization
-                resource_types = {}
-                for row in krt_data:
-                    resource_type = row.get('RESOURCE TYPE', 'Other')
-                    if resource_type not in resource_types:
-                        resource_types[resource_type] = []
-                    resource_types[resource_type].append(row)
-                
-                # Add KRT validation
-                validation_warnings = validate_krt_completeness(krt_data)
-                quality_score, max_score, quality_notes = get_krt_quality_score(krt_data)
-                improvement_suggestions = suggest_krt_improvements(krt_data)
-                
-                context.update({
-                    'krt_data': krt_data,
-                    'resource_types': resource_types,
-                    'resource_count': len(krt_data),
-                    'new_count': len([r for r in krt_data if r.get('NEW/REUSE', '').lower() == 'new']),
-                    'reuse_count': len([r for r in krt_data if r.get('NEW/REUSE', '').lower() == 'reuse']),
-                    'validation_warnings': validation_warnings,
-                    'quality_score': quality_score,
-                    'max_quality_score': max_score,
-                    'quality_notes': quality_notes,
-                    'improvement_suggestions': improvement_suggestions,
-                    'quality_percentage': int((quality_score / max_score) * 100) if max_score > 0 else 0,
-                })
+                # Completed sessions don't change, so the derived context is cached with them
+                context.update(cache.get_or_set(
+                    KRTSession.results_cache_key(session_id),
+                    lambda: self._build_results_context(session),
+                    SESSION_CACHE_TIMEOUT,
+                ))
             
         except KRTSession.DoesNotExist:
             messages.error(self.request, 'Session not found or expired.')
             return redirect('web:home')
         
         return context
+    
+    @staticmethod
+    def _build_results_context(session):
+        """KRT rows grouped by resource type plus the quality report, for a completed session"""
+        krt_data = session.krt_data or []
+        
+        # Group by resource type for better visualization (new/reuse counts are stored on the session)
+        resource_types = {}
+        for row in krt_data:
+            resource_types.setdefault(row.get('RESOURCE TYPE', 'Other'), []).append(row)
+        
+        # KRT validation results are stored with the session when it completes;
+        # only sessions saved before that was added need them computed here
+        if session.quality_report:
+            quality_score = session.quality_score
+            quality_percentage = session.quality_percentage
+            quality_report = session.quality_report
+        else:
+            quality_score, quality_percentage, quality_report = KRTSession.compute_quality(krt_data)
+        
+        return {
+            'krt_data': krt_data,
+            'resource_types': resource_types,
+            'resource_count': len(krt_data),
+            'new_count': session.new_resources,
+            'reuse_count': session.reused_resources,
+            'validation_warnings': quality_report['warnings'],
+            'quality_score': quality_score,
+            'max_quality_score': quality_report['max_score'],
+            'quality_notes': quality_report['notes'],
+            'improvement_suggestions': quality_report['suggestions'],
+            'quality_percentage': quality_percentage,
+        }
 
 
 class ArticleDashboardView(TemplateView):
     """Dashboard showing all processed articles with their metadata and LLM comparison"""
     template_name = 'web/article_dashboard.html'
     
+    # Same for every visitor and changes slowly; signals.py also drops it when a session changes
+    CONTEXT_CACHE_TIMEOUT = 300
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        
+        context.update(cache.get_or_set(KRTSession.DASHBOARD_CACHE_KEY, self._build_context, self.CONTEXT_CACHE_TIMEOUT))
+        return context
+    
+    def _build_context(self):
+        """Article list and LLM comparison statistics"""
         # Get unique articles using the class method
         unique_articles = KRTSession.get_unique_articles()
         
         # Statistics
         total_articles = len(unique_articles)
-        total_sessions = KRTSession.objects.filter(status='completed').count()
-        biorxiv_articles = len([a for a in unique_articles if a['primary_session'].is_biorxiv_paper])
-        
-        # LLM usage statistics
-        llm_stats = {}
-        for article in unique_articles:
-            for llm_result in article['llm_results']:
-                provider_model = f"{llm_result['provider']}_{llm_result['model']}"
-                if provider_model not in llm_stats:
-                    llm_stats[provider_model] = {
-                        'count': 0, 
-                        'avg_resources': 0, 
-                        'avg_time': 0,
-                        'provider': llm_result['provider'],
-                        'model': llm_result['model']
-                    }
-                llm_stats[provider_model]['count'] += 1
-                llm_stats[provider_model]['avg_resources'] += llm_result['resources_found']
-                llm_stats[provider_model]['avg_time'] += llm_result['processing_time'] or 0
-        
-        # Calculate averages
-        for stats in llm_stats.values():
-            if stats['count'] > 0:
-                stats['avg_resources'] = round(stats['avg_resources'] / stats['count'], 1)
-                stats['avg_time'] = round(stats['avg_time'] / stats['count'], 2)
+        completed_sessions = KRTSession.objects.filter(status='completed')
+        # Session total and distinct bioRxiv DOIs (URL submissions) in one aggregate;
+        # COUNT(DISTINCT doi) already skips NULL DOIs
+        session_counts = completed_sessions.aggregate(
+            total=Count('id'),
+            biorxiv=Count('doi', distinct=True, filter=Q(input_method='url') & ~Q(doi='')),
+        )
+        total_sessions = session_counts['total']
+        biorxiv_articles = session_counts['biorxiv']
+        
+        # LLM usage statistics - one GROUP BY instead of walking every session in Python
+        llm_stats = [
+            {
+                'provider': row['provider'],
+                'model': row['model_name'],
+                'count': row['count'],
+                'avg_resources': round(row['avg_resources'] or 0, 1),
+                'avg_time': round(row['avg_time'] or 0, 2),
+            }
+            for row in completed_sessions.filter(mode='llm').values('provider', 'model_name').annotate(
+                count=Count('id'),
+                avg_resources=Avg('resources_found'),
+                avg_time=Avg('processing_time'),
+            ).order_by('provider', 'model_name')
+        ]
         
-        context.update({
+        return {
             'articles': unique_articles,
             'total_articles': total_articles,
             'total_sessions': total_sessions,
             'biorxiv_articles': biorxiv_articles,
             'upload_articles': total_articles - biorxiv_articles,
-            'llm_stats': list(llm_stats.values()),
-        })
-        
-        return context
+            'llm_stats': llm_stats,
+        }
 
 
 class ArticleProfileView(TemplateView):
     """Detailed profile page for a specific article showing all LLM results and metadata"""
     template_name = 'web/article_profile.html'
     
+    # Large per-session blobs the profile page never renders (KRT rows are loaded via the AJAX API)
+    DEFERRED_FIELDS = ('krt_data', 'extra_instructions', 'error_message')
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Get article identifier from URL
         identifier = kwargs.get('identifier')
         
-        # Find sessions for this article (by DOI or session_id)
-        if identifier.startswith('10.1101/') or '/' in identifier:
-            # DOI identifier (bioRxiv DOIs start with 10.1101/)
-            sessions = KRTSession.objects.filter(doi=identifier, status='completed').order_by('-created_at')
-            article_key = identifier
-        else:
-            # Session ID identifier - find by session and then group by DOI/filename
-            try:
-                primary_session = KRTSession.objects.get(session_id=identifier, status='completed')
-                article_key = primary_session.doi or primary_session.original_filename
-                sessions = KRTSession.objects.filter(
-                    Q(doi=article_key) | Q(original_filename=article_key),
-                    status='completed'
-                ).order_by('-created_at')
-            except KRTSession.DoesNotExist:
-                messages.error(self.request, 'Article not found.')
-                return redirect('web:article_dashboard')
-        
-        if not sessions.exists():
+        # Find sessions for this article (by DOI or session_id) in one query.
+        # Materialized once: the grouping and averages below all work on this list
+        match_key = self._article_key_expression(identifier)
+        sessions = list(KRTSession.objects.filter(
+            Q(doi=match_key) | Q(original_filename=match_key),
+            status='completed'
+        ).defer(*self.DEFERRED_FIELDS).order_by('-created_at'))
+        
+        if not sessions:
             messages.error(self.request, 'Article not found.')
             return redirect('web:article_dashboard')
         
+        article_key = self._article_key(identifier, sessions)
+        
         # Primary session (most recent or best)
-        primary_session = sessions.first()
+        primary_session = sessions[0]
         
         # Group sessions by LLM model
         llm_results = {}
@@ -489,24 +676,21 @@ class ArticleProfileView(TemplateView):
             else:
                 regex_results.append(session)
         
-        # Calculate averages for each LLM
+        # Calculate averages for each LLM from the sessions already fetched (missing times count as 0)
         for result in llm_results.values():
-            sessions_list = result['sessions']
-            result['avg_resources'] = sum(s.resources_found for s in sessions_list) / len(sessions_list)
-            result['avg_time'] = sum(s.processing_time or 0 for s in sessions_list) / len(sessions_list)
+            result['avg_resources'] = fmean(s.resources_found for s in result['sessions'])
+            result['avg_time'] = fmean(s.processing_time or 0 for s in result['sessions'])
         
         # Check for existing KRT in the article
         existing_krt_info = self._detect_existing_krt(primary_session)
         
-        # Get admin-generated KRTs for this article/DOI
+        # Get admin-generated KRTs for this article/DOI (one query, consumed twice)
         admin_krts = []
-        if primary_session.doi:
-            admin_krts = AdminKRT.get_for_doi(primary_session.doi)
-        
-        # Get best admin KRT for quick comparison
         best_admin_krt = None
         if primary_session.doi:
-            best_admin_krt = AdminKRT.get_best_for_doi(primary_session.doi)
+            admin_krts = list(AdminKRT.get_for_doi(primary_session.doi).select_related('xml_file'))
+            # Best admin KRT for quick comparison: same ordering as AdminKRT.get_best_for_doi
+            best_admin_krt = next((krt for krt in admin_krts if krt.status == 'approved'), None)
         
         context.update({
             'primary_session': primary_session,
@@ -514,7 +698,7 @@ class ArticleProfileView(TemplateView):
             'all_sessions': sessions,
             'llm_results': list(llm_results.values()),
             'regex_results': regex_results,
-            'total_sessions': sessions.count(),
+            'total_sessions': len(sessions),
             'article_key': article_key,
             'existing_krt_info': existing_krt_info,
             'admin_krts': admin_krts,
@@ -523,6 +707,34 @@ class ArticleProfileView(TemplateView):
         
         return context
     
+    @staticmethod
+    def _is_doi(identifier):
+        """bioRxiv DOIs start with 10.1101/; session IDs never contain a slash"""
+        return identifier.startswith('10.1101/') or '/' in identifier
+    
+    @classmethod
+    def _article_key_expression(cls, identifier):
+        """
+        The DOI/filename an article's sessions are grouped by, as a value or SQL expression.
+        A session ID maps to its DOI, or its filename for uploads without one - resolved as a
+        subquery so the profile needs a single query either way.
+        """
+        if cls._is_doi(identifier):
+            return identifier
+        return Subquery(
+            KRTSession.objects.filter(session_id=identifier, status='completed')
+            .annotate(key=Coalesce(NullIf('doi', Value('')), 'original_filename'))
+            .values('key')[:1]
+        )
+    
+    @classmethod
+    def _article_key(cls, identifier, sessions):
+        """The grouping key for an identifier, read back from the sessions it matched"""
+        if cls._is_doi(identifier):
+            return identifier
+        session = next(s for s in sessions if s.session_id == identifier)
+        return session.doi or session.original_filename
+    
     def _detect_existing_krt(self, session):
         """Detect if the article already contains KRT tables"""
         return {
@@ -537,23 +749,39 @@ class AdminKRTManagementView(TemplateView):
     """Admin interface for managing admin-generated KRTs"""
     template_name = 'web/admin_krt_management.html'
     
+    # Several aggregates that change slowly; signals.py also drops it when an admin KRT changes
+    CONTEXT_CACHE_TIMEOUT = 300
+    
+    # Columns the recent/featured lists render - skips krt_data, token_usage and the notes fields
+    LIST_FIELDS = (
+        'id', 'created_at', 'doi', 'provider', 'model_name', 'resources_found', 'processing_time',
+        'status', 'quality_rating', 'is_public', 'is_featured',
+        'xml_file', 'xml_file__doi', 'xml_file__title',
+    )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        
+        context.update(cache.get_or_set(AdminKRT.MANAGEMENT_CACHE_KEY, self._build_context, self.CONTEXT_CACHE_TIMEOUT))
+        return context
+    
+    def _build_context(self):
+        """Admin KRT statistics, recent/pending/featured lists and per-model breakdown"""
         # Get statistics about admin KRTs
         stats = AdminKRT.get_statistics()
         
-        # Get recent admin KRTs
-        recent_krts = AdminKRT.objects.select_related('xml_file').order_by('-created_at')[:20]
+        # Get recent admin KRTs (lists, so the cached context holds rows rather than lazy querysets)
+        recent_krts = list(
+            AdminKRT.objects.select_related('xml_file').only(*self.LIST_FIELDS).order_by('-created_at')[:20]
+        )
         
         # Get pending KRTs that need generation
-        pending_krts = AdminKRT.get_pending_generation(limit=50)
+        pending_krts = list(AdminKRT.get_pending_generation(limit=50))
         
         # Get featured/high-quality KRTs
-        featured_krts = AdminKRT.objects.filter(
+        featured_krts = list(AdminKRT.objects.filter(
             is_featured=True, 
             is_public=True
-        ).select_related('xml_file').order_by('-created_at')[:10]
+        ).select_related('xml_file').only(*self.LIST_FIELDS).order_by('-created_at')[:10])
         
         # Get provider/model breakdown
         provider_stats = {}
@@ -571,54 +799,64 @@ class AdminKRTManagementView(TemplateView):
                 'avg_time': round(krt['avg_time'] or 0, 2)
             }
         
-        context.update({
+        return {
             'stats': stats,
             'recent_krts': recent_krts,
             'pending_krts': pending_krts,
             'featured_krts': featured_krts,
             'provider_stats': list(provider_stats.values()),
             'xml_file_count': XMLFile.objects.filter(is_available=True).count(),
-        })
-        
-        return context
+        }
 
 
 class DatabaseManagementView(TemplateView):
     """Database management interface for populating and managing the article database"""
     template_name = 'web/database_management.html'
     
+    # Article counts only change when articles are (re)populated; signals.py drops the cache then
+    STATS_CACHE_TIMEOUT = 60
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        
-        # Get database statistics
-        total_articles = Article.objects.count()
-        articles_with_sessions = Article.objects.filter(total_sessions__gt=0).count()
-        articles_with_krt = Article.objects.filter(has_existing_krt=True).count()
+        context.update(cache.get_or_set(Article.MANAGEMENT_STATS_CACHE_KEY, self._compute_stats, self.STATS_CACHE_TIMEOUT))
+        return context
+    
+    @staticmethod
+    def _compute_stats():
+        """Article counts, recent articles and year/journal distributions"""
+        # Get database statistics (one aggregate instead of three COUNT queries)
+        article_counts = Article.objects.aggregate(
+            total=Count('id'),
+            with_sessions=Count('id', filter=Q(total_sessions__gt=0)),
+            with_krt=Count('id', filter=Q(has_existing_krt=True)),
+        )
+        total_articles = article_counts['total']
+        articles_with_sessions = article_counts['with_sessions']
+        articles_with_krt = article_counts['with_krt']
         
         # Get latest articles
-        recent_articles = Article.objects.order_by('-last_processed')[:10]
-        
-        # Get year statistics from existing articles
-        year_distribution = {}
-        for article in Article.objects.filter(publication_date__isnull=False):
-            year = article.publication_date.year
-            year_distribution[year] = year_distribution.get(year, 0) + 1
-        
-        # Get journal distribution
-        journal_distribution = {}
-        for article in Article.objects.filter(journal__isnull=False).exclude(journal=''):
-            journal = article.journal
-            journal_distribution[journal] = journal_distribution.get(journal, 0) + 1
+        recent_articles = list(Article.objects.order_by('-last_processed')[:10])
+        
+        # Get year statistics from existing articles (10 most recent years)
+        year_distribution = dict(
+            Article.objects.filter(publication_date__isnull=False)
+            .annotate(year=ExtractYear('publication_date'))
+            .values('year').annotate(c=Count('id'))
+            .order_by('-year').values_list('year', 'c')[:10]
+        )
         
-        # Sort distributions
-        year_distribution = dict(sorted(year_distribution.items(), reverse=True)[:10])
-        journal_distribution = dict(sorted(journal_distribution.items(), key=lambda x: x[1], reverse=True)[:10])
+        # Get journal distribution (10 most common journals)
+        journal_distribution = dict(
+            Article.objects.filter(journal__isnull=False).exclude(journal='')
+            .values('journal').annotate(c=Count('id'))
+            .order_by('-c').values_list('journal', 'c')[:10]
+        )
         
         # Population status
         expected_total = 19405  # Based on our Europe PMC statistics
         population_percentage = (total_articles / expected_total * 100) if expected_total > 0 else 0
         
-        context.update({
+        return {
             'total_articles': total_articles,
             'articles_with_sessions': articles_with_sessions,
             'articles_with_krt': articles_with_krt,
@@ -629,9 +867,7 @@ class DatabaseManagementView(TemplateView):
             'expected_total': expected_total,
             'population_percentage': population_percentage,
             'is_populated': total_articles > 1000,  # Consider populated if more than 1000 articles
-        })
-        
-        return context
+        }
     
     def post(self, request, *args, **kwargs):
         """Handle database population requests"""
@@ -659,12 +895,101 @@ class DatabaseManagementView(TemplateView):
         return redirect('web:database_management')
 
 
+# KRT rows formatted per streamed CSV chunk (columns are always written in KRT_COLUMNS order)
+CSV_STREAM_BATCH_SIZE = 500
+
+
+# Formats export_krt can produce ('json', 'csv', 'excel')
+EXPORT_FORMATS = frozenset(dict(KRTExport.EXPORT_FORMATS))
+
+# Rendered Excel exports, reused by repeat downloads of the same session. Larger
+# workbooks are streamed from a temp file each time rather than kept in the cache
+EXPORT_CACHE_TIMEOUT = 60 * 60
+EXPORT_CACHE_MAX_SIZE = 1024 * 1024
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+_get_krt_columns = itemgetter(*KRT_COLUMNS)
+
+
+def krt_row_values(row):
+    """A KRT row's values as a tuple in KRT_COLUMNS order ('' for any missing column)"""
+    try:
+        return _get_krt_columns(row)
+    except KeyError:
+        return tuple(row.get(column, '') for column in KRT_COLUMNS)
+
+
+def _write_excel_export(session, krt_data, output):
+    """Write a session's KRT as an xlsx workbook (metadata lines, then the table) to a binary file"""
+    headers = KRT_COLUMNS
+    metadata = [
+        f"Key Resources Table - {session.display_title}",
+        f"Session ID: {session.session_id}",
+        f"DOI: {session.doi or 'N/A'}",
+        f"Processed: {session.created_at.strftime('%Y-%m-%d %H:%M')}",
+        f"Mode: {session.mode.upper()}",
+    ]
+    if session.provider:
+        metadata.append(f"Provider: {session.provider} ({session.model_name})")
+    
+    # Write-only sheets stream rows out and can't be re-read, so size the columns
+    # up front in a single pass over the rows (column A also holds the metadata lines)
+    # Rows are projected to tuples in header order once and reused for writing below
+    rows = [krt_row_values(row) for row in krt_data]
+    max_len = [len(header) for header in headers]
+    max_len[0] = max([max_len[0]] + [len(line) for line in metadata])
+    for values in rows:
+        for col, value in enumerate(values):
+            length = len(value) if isinstance(value, str) else len(str(value))
+            if length > max_len[col]:
+                max_len[col] = length
+    
+    # Create workbook in write-only mode - rows go straight to the xlsx stream
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Key Resources Table")
+    for col, length in enumerate(max_len, 1):
+        ws.column_dimensions[get_column_letter(col)].width = min(length + 2, 50)  # Cap at 50 characters
+    
+    # Add metadata
+    title_cell = WriteOnlyCell(ws, value=metadata[0])
+    title_cell.font = EXCEL_TITLE_FONT
+    ws.append([title_cell])
+    for line in metadata[1:]:
+        ws.append([line])
+    
+    # Blank rows up to the header row
+    header_row = 8
+    for _ in range(header_row - 1 - len(metadata)):
+        ws.append([])
+    
+    # Add headers
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = EXCEL_HEADER_FONT
+        cell.fill = EXCEL_HEADER_FILL
+        header_cells.append(cell)
+    ws.append(header_cells)
+    
+    # Add data
+    for values in rows:
+        ws.append(values)
+    
+    wb.save(output)
+
+
 @require_http_methods(["GET"])
 def export_krt(request, session_id, format_type):
     """Export KRT data in various formats"""
-    try:
-        session = KRTSession.objects.get(session_id=session_id, status='completed')
-    except KRTSession.DoesNotExist:
+    # Reject unknown formats before touching the database or the export log
+    if format_type not in EXPORT_FORMATS:
+        return JsonResponse({'error': 'Invalid format type'}, status=400)
+    
+    # Completed sessions come from the session cache, so repeat downloads skip
+    # fetching and decoding the krt_data blob again
+    session = get_session_cached(session_id)
+    if session is None or session.status != 'completed':
         return JsonResponse({'error': 'Session not found'}, status=404)
     
     # Get KRT data
@@ -674,15 +999,10 @@ def export_krt(request, session_id, format_type):
         return JsonResponse({'error': 'No KRT data available'}, status=404)
     
     # Record export for analytics
-    KRTExport.objects.create(
-        session=session,
-        format=format_type,
-        ip_address=request.META.get('REMOTE_ADDR'),
-        user_agent=request.META.get('HTTP_USER_AGENT', '')[:500]
-    )
+    log_export(session.pk, format_type, request.META.get('REMOTE_ADDR'), request.headers.get('User-Agent', '')[:500])
     
     if format_type == 'json':
-        response = JsonResponse({
+        response = json_response({
             'title': session.display_title,
             'session_id': session_id,
             'doi': session.doi,
@@ -692,101 +1012,56 @@ def export_krt(request, session_id, format_type):
             'model': session.model_name,
             'resources_found': len(krt_data),
             'krt_data': krt_data
-        }, json_dumps_params={'indent': 2})
+        }, indent=True)
         response['Content-Disposition'] = f'attachment; filename="krt_{session_id}.json"'
         return response
     
     elif format_type == 'csv':
-        import csv
-        from io import StringIO
-        
-        output = StringIO()
-        if krt_data:
-            # Use the keys from the first row, but ensure proper order
-            fieldnames = [
-                'RESOURCE TYPE', 'RESOURCE NAME', 'SOURCE', 
-                'IDENTIFIER', 'NEW/REUSE', 'ADDITIONAL INFORMATION'
-            ]
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for row in krt_data:
-                # Create a clean row with all required fields
-                clean_row = {}
-                for field in fieldnames:
-                    clean_row[field] = row.get(field, '')
-                writer.writerow(clean_row)
-        
-        response = HttpResponse(output.getvalue(), content_type='text/csv')
+        def csv_rows():
+            # Format rows in batches with writerows() and stream each batch as one chunk
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(KRT_COLUMNS)
+            for start in range(0, len(krt_data), CSV_STREAM_BATCH_SIZE):
+                batch = krt_data[start:start + CSV_STREAM_BATCH_SIZE]
+                writer.writerows(map(krt_row_values, batch))
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        
+        response = StreamingHttpResponse(csv_rows(), content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="krt_{session_id}.csv"'
         return response
     
     elif format_type == 'excel':
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill
-            from io import BytesIO
-        except ImportError:
+        if not OPENPYXL_AVAILABLE:
             return JsonResponse({'error': 'Excel export not available (openpyxl not installed)'}, status=500)
         
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Key Resources Table"
-        
-        # Add metadata
-        ws['A1'] = f"Key Resources Table - {session.display_title}"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A2'] = f"Session ID: {session_id}"
-        ws['A3'] = f"DOI: {session.doi or 'N/A'}"
-        ws['A4'] = f"Processed: {session.created_at.strftime('%Y-%m-%d %H:%M')}"
-        ws['A5'] = f"Mode: {session.mode.upper()}"
-        if session.provider:
-            ws['A6'] = f"Provider: {session.provider} ({session.model_name})"
-        
-        # Add headers
-        headers = [
-            'RESOURCE TYPE', 'RESOURCE NAME', 'SOURCE', 
-            'IDENTIFIER', 'NEW/REUSE', 'ADDITIONAL INFORMATION'
-        ]
-        header_row = 8
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=header_row, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        
-        # Add data
-        for row_idx, data_row in enumerate(krt_data, header_row + 1):
-            for col_idx, header in enumerate(headers, 1):
-                ws.cell(row=row_idx, column=col_idx, value=data_row.get(header, ''))
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            ws.column_dimensions[column_letter].width = adjusted_width
-        
-        # Save to BytesIO
-        output = BytesIO()
-        wb.save(output)
+        # Rendered workbooks are cached for repeat downloads. The key carries the session's
+        # updated_at, so any change to the session misses and stale copies just expire
+        cache_key = KRTSession.export_cache_key(session_id, format_type, session.updated_at)
+        content = cache.get(cache_key)
+        if content is not None:
+            response = HttpResponse(content, content_type=XLSX_CONTENT_TYPE)
+            response['Content-Disposition'] = f'attachment; filename="krt_{session_id}.xlsx"'
+            return response
+        
+        # Build into an anonymous temp file and stream it from there, so the workbook is never
+        # held in memory twice; FileResponse closes (and so deletes) it after the download.
+        # Only workbooks up to EXPORT_CACHE_MAX_SIZE are also read back into the cache
+        output = tempfile.TemporaryFile()
+        _write_excel_export(session, krt_data, output)
+        if output.tell() <= EXPORT_CACHE_MAX_SIZE:
+            output.seek(0)
+            cache.set(cache_key, output.read(), EXPORT_CACHE_TIMEOUT)
         output.seek(0)
         
-        response = HttpResponse(
-            output.getvalue(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename=f"krt_{session_id}.xlsx",
+            content_type=XLSX_CONTENT_TYPE
         )
-        response['Content-Disposition'] = f'attachment; filename="krt_{session_id}.xlsx"'
-        return response
-    
-    else:
-        return JsonResponse({'error': 'Invalid format type'}, status=400)
 
 
 @require_http_methods(["POST"])
@@ -796,32 +1071,40 @@ def check_doi_availability(request):
     Returns availability status and detailed information.
     """
     try:
-        data = json.loads(request.body)
+        data = json_loads(request.body)
         doi_input = data.get('doi', '').strip()
         
         if not doi_input:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'No DOI provided'
             }, status=400)
         
-        # Initialize fetcher
-        fetcher = BioRxivFetcher()
+        fetcher = _fetcher
         
         # Parse DOI from input (handles URLs and DOIs)
-        doi = fetcher.parse_biorxiv_identifier(doi_input)
+        doi = parse_doi_cached(doi_input)
         if not doi:
-            return JsonResponse({
+            return json_response({
                 'success': False,
                 'error': 'Invalid bioRxiv URL or DOI format',
                 'details': 'Please provide a valid bioRxiv DOI (e.g., 10.1101/2025.01.01.123456) or URL'
             }, status=400)
         
-        # Step 1: Search for EPMC ID
-        epmc_id = fetcher.search_epmc_for_doi(doi)
+        lookup_cache_key = f"epmc:v1:{doi}"
+        cached_response = cache.get(lookup_cache_key)
+        if cached_response is not None:
+            return json_response(cached_response)
+        
+        # Metadata only needs the DOI, so fetch it while steps 1 and 2 run
+        metadata_future = _lookup_executor.submit(get_cached_metadata, doi)
+        
+        # Step 1: Search for EPMC ID (cached per DOI, so re-runs of a paper skip the search)
+        epmc_id = get_cached_epmc_id(doi)
         
         if not epmc_id:
-            return JsonResponse({
+            metadata_future.cancel()
+            return json_response({
                 'success': False,
                 'error': 'Paper not found in Europe PMC',
                 'details': f'DOI {doi} was not found in the Europe PMC database. This could mean the paper is very new or not indexed yet.',
@@ -832,8 +1115,10 @@ def check_doi_availability(request):
         # Step 2: Check full text availability
         full_text_status = fetcher.check_full_text_availability(epmc_id)
         
-        # Step 3: Get basic metadata for display
-        metadata = fetcher.get_paper_metadata(doi) or {}
+        # Step 3: Basic metadata for display (usually already fetched by now)
+        metadata = metadata_future.result() or {}
+        
+        full_text_available = full_text_status['available']
         
         # Prepare response
         response_data = {
@@ -841,23 +1126,23 @@ def check_doi_availability(request):
             'doi': doi,
             'epmc_id': epmc_id,
             'indexed': True,
-            'full_text_available': full_text_status['available'],
-            'can_extract_krt': full_text_status['available'],  # Only if full text is available
+            'full_text_available': full_text_available,
+            'can_extract_krt': full_text_available,  # Only if full text is available
             'metadata': {
                 'title': metadata.get('preprint_title', 'Title not available'),
                 'authors': metadata.get('preprint_authors', 'Authors not available'),
                 'date': metadata.get('preprint_date', 'Date not available'),
                 'journal': metadata.get('preprint_platform', 'bioRxiv'),
-                'abstract': metadata.get('preprint_abstract', '')[:200] + '...' if metadata.get('preprint_abstract') else 'Abstract not available'
+                'abstract': abstract[:200] + '...' if (abstract := metadata.get('preprint_abstract')) else 'Abstract not available'
             },
             'availability_details': full_text_status
         }
         
         # Add specific messages based on availability status
-        if full_text_status['available']:
+        if full_text_available:
             response_data['message'] = f"✅ Full text XML is available for KRT extraction!"
-            if full_text_status.get('content_length'):
-                response_data['message'] += f" (File size: ~{full_text_status['content_length']} bytes)"
+            if content_length := full_text_status.get('content_length'):
+                response_data['message'] += f" (File size: ~{content_length} bytes)"
         else:
             if full_text_status.get('status_code') == 404:
                 response_data['message'] = f"⚠️ Paper is indexed but full text XML is not yet available. This often happens with very recent preprints."
@@ -866,16 +1151,20 @@ def check_doi_availability(request):
                 response_data['message'] = f"❌ Full text XML is not available. Error: {full_text_status.get('error', 'Unknown error')}"
                 response_data['suggestion'] = "You may need to contact the authors directly for the manuscript."
         
-        return JsonResponse(response_data)
+        cache.set(
+            lookup_cache_key, response_data,
+            EPMC_LOOKUP_CACHE_TIMEOUT if full_text_available else EPMC_UNAVAILABLE_CACHE_TIMEOUT,
+        )
+        return json_response(response_data)
         
     except json.JSONDecodeError:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': 'Invalid JSON in request body'
         }, status=400)
         
     except Exception as e:
-        return JsonResponse({
+        return json_response({
             'success': False,
             'error': 'Server error while checking DOI availability',
             'details': str(e)
@@ -883,35 +1172,116 @@ def check_doi_availability(request):
 
 
 @require_http_methods(["GET"])
+def api_status(request, session_id):
+    """
+    Lightweight status endpoint polled while a KRT extraction runs in the background.
+    """
+    session = (
+        KRTSession.objects.filter(session_id=session_id)
+        .only('session_id', 'status', 'error_message', 'resources_found', 'processing_time')
+        .first()
+    )
+    if session is None:
+        return JsonResponse({
+            'success': False,
+            'error': 'Session not found'
+        }, status=404)
+
+    stage, progress = extraction_progress(session.session_id, session.status)
+    data = {
+        'success': True,
+        'session_id': session.session_id,
+        'status': session.status,
+        'stage': stage,
+        'progress': progress,
+        'done': session.status in ('completed', 'failed'),
+    }
+    if session.status == 'completed':
+        data['resources_found'] = session.resources_found
+        data['processing_time'] = session.processing_time
+        data['results_url'] = reverse('web:results', args=[session.session_id])
+    elif session.status == 'failed':
+        data['error'] = session.error_message
+
+    return JsonResponse(data)
+
+
+def _best_sessions_for_doi(doi):
+    """Completed sessions with KRT data for a DOI, best (most resources, then newest) first"""
+    return KRTSession.objects.filter(
+        doi=doi,
+        status='completed'
+    ).exclude(
+        krt_data__isnull=True
+    ).exclude(
+        krt_data=''
+    ).order_by('-resources_found', '-created_at')
+
+
+# Columns behind the summary/article_info part of the DOI API response
+SESSION_SUMMARY_FIELDS = (
+    'session_id', 'doi', 'biorxiv_id', 'input_method', 'original_filename', 'title', 'authors',
+    'publication_date', 'journal', 'resources_found', 'new_resources', 'reused_resources',
+    'processing_time', 'provider', 'model_name', 'mode', 'created_at',
+)
+
+
+def _session_etag(session_id, updated_at, status):
+    # status is part of the tag because queryset.update() calls don't bump updated_at
+    return f"{session_id}-{updated_at.timestamp()}-{status}"
+
+
+def krt_data_etag(request, session_id):
+    """ETag for get_krt_data_api from a single indexed lookup, without loading the KRT rows"""
+    row = KRTSession.objects.filter(session_id=session_id).values_list('updated_at', 'status').first()
+    return _session_etag(session_id, *row) if row else None
+
+
+def _ranked_doi_row(request, doi):
+    """
+    (session_id, updated_at, status, total_sessions) of a DOI's best session, or None.
+    Ranked once per request and kept on it, so the ETag check and the view share the query.
+    """
+    if not hasattr(request, '_krt_doi_row'):
+        request._krt_doi_row = _best_sessions_for_doi(doi).annotate(
+            total_sessions=Window(Count('id'))
+        ).values_list('session_id', 'updated_at', 'status', 'total_sessions').first()
+    return request._krt_doi_row
+
+
+def krt_data_by_doi_etag(request, doi):
+    """ETag for get_krt_data_by_doi_api - changes when the best session, its data or the session count changes"""
+    row = _ranked_doi_row(request, doi)
+    return f"{_session_etag(*row[:3])}-{row[3]}" if row else None
+
+
+@require_http_methods(["GET"])
+@gzip_page
+@condition(etag_func=krt_data_etag)
 def get_krt_data_api(request, session_id):
     """
     API endpoint to retrieve KRT data by session ID for AJAX modal display.
     """
     try:
         # Get the session
-        session = get_object_or_404(KRTSession, session_id=session_id)
+        session = get_session_cached(session_id)
+        if session is None:
+            raise KRTSession.DoesNotExist
         
         # Parse KRT data (handle both list and JSON string formats)
-        krt_data = []
-        if session.krt_data:
-            if isinstance(session.krt_data, list):
-                krt_data = session.krt_data
-            elif isinstance(session.krt_data, str):
-                try:
-                    krt_data = json.loads(session.krt_data)
-                except json.JSONDecodeError:
-                    return JsonResponse({
-                        'success': False,
-                        'error': 'Invalid KRT data format'
-                    }, status=500)
-            else:
-                krt_data = []
+        try:
+            krt_data = get_krt_rows(session)
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'success': False,
+                'error': 'Invalid KRT data format'
+            }, status=500)
         
-        # Calculate summary statistics
+        # Summary statistics (new/reuse counts are stored by update_analytics)
         summary = {
             'total_resources': len(krt_data),
-            'new_resources': sum(1 for item in krt_data if item.get('NEW/REUSE', '').lower() == 'new'),
-            'reused_resources': sum(1 for item in krt_data if item.get('NEW/REUSE', '').lower() == 'reuse'),
+            'new_resources': session.new_resources,
+            'reused_resources': session.reused_resources,
             'processing_time': float(session.processing_time) if session.processing_time else 0,
             'provider': session.provider,
             'model': session.model_name,
@@ -919,7 +1289,7 @@ def get_krt_data_api(request, session_id):
             'created_at': session.created_at.isoformat(),
         }
         
-        return JsonResponse({
+        return json_response({
             'success': True,
             'session_id': session_id,
             'krt_data': krt_data,
@@ -945,60 +1315,61 @@ def get_krt_data_api(request, session_id):
 
 
 @require_http_methods(["GET"])
+@gzip_page
+@condition(etag_func=krt_data_by_doi_etag)
 def get_krt_data_by_doi_api(request, doi):
     """
     API endpoint to retrieve KRT data by DOI for external API access.
     Returns the best KRT result for the given DOI.
+    Pass ?summary_only=1 to get the summary and article info without the KRT rows.
     """
     try:
-        # Find the best session for this DOI (highest resource count)
-        sessions = KRTSession.objects.filter(
-            doi=doi,
-            status='completed'
-        ).exclude(
-            krt_data__isnull=True
-        ).exclude(
-            krt_data=''
-        ).order_by('-resources_found', '-created_at')
+        summary_only = request.GET.get('summary_only', '').lower() in ('1', 'true')
+        
+        # The best session (highest resource count) with the count of all the DOI's
+        # sessions alongside - already ranked by the ETag check
+        best_row = _ranked_doi_row(request, doi)
+        
+        best_session = None
+        if best_row is None:
+            pass
+        elif summary_only:
+            # Everything in a summary response is a plain column - skip loading krt_data
+            best_session = KRTSession.objects.only(*SESSION_SUMMARY_FIELDS).filter(session_id=best_row[0]).first()
+        else:
+            best_session = get_session_cached(best_row[0])
         
-        if not sessions.exists():
+        if best_session is None:
             return JsonResponse({
                 'success': False,
                 'error': f'No completed KRT sessions found for DOI: {doi}'
             }, status=404)
         
-        best_session = sessions.first()
-        
         # Parse KRT data (handle both list and JSON string formats)
-        krt_data = []
-        if best_session.krt_data:
-            if isinstance(best_session.krt_data, list):
-                krt_data = best_session.krt_data
-            elif isinstance(best_session.krt_data, str):
-                try:
-                    krt_data = json.loads(best_session.krt_data)
-                except json.JSONDecodeError:
-                    return JsonResponse({
-                        'success': False,
-                        'error': 'Invalid KRT data format'
-                    }, status=500)
-            else:
-                krt_data = []
+        krt_data = None
+        if not summary_only:
+            try:
+                krt_data = get_krt_rows(best_session)
+            except json.JSONDecodeError:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Invalid KRT data format'
+                }, status=500)
         
-        # Calculate summary statistics
+        # Summary statistics (counts are stored whenever krt_data is saved)
         summary = {
-            'total_resources': len(krt_data),
-            'new_resources': sum(1 for item in krt_data if item.get('NEW/REUSE', '').lower() == 'new'),
-            'reused_resources': sum(1 for item in krt_data if item.get('NEW/REUSE', '').lower() == 'reuse'),
+            'total_resources': best_session.resources_found if summary_only else len(krt_data),
+            'new_resources': best_session.new_resources,
+            'reused_resources': best_session.reused_resources,
             'processing_time': float(best_session.processing_time) if best_session.processing_time else 0,
             'provider': best_session.provider,
             'model': best_session.model_name,
             'mode': best_session.mode,
             'created_at': best_session.created_at.isoformat(),
-            'total_sessions': sessions.count(),
+            'total_sessions': best_row[3],
         }
         
-        return JsonResponse({
+        response_data = {
             'success': True,
             'doi': doi,
             'session_id': best_session.session_id,
@@ -1011,7 +1382,11 @@ def get_krt_data_by_doi_api(request, doi):
                 'journal': best_session.journal,
                 'is_biorxiv_paper': best_session.is_biorxiv_paper,
             }
-        })
+        }
+        if summary_only:
+            del response_data['krt_data']
+        
+        return json_response(response_data)
         
     except Exception as e:
         return JsonResponse({
@@ -1048,20 +1423,18 @@ def get_doi_suggestions(request):
         else:
             batch_size = 10  # Initial load: 10 per year for overview
         
-        # Base queryset of available XML files
+        # Base queryset of available XML files (only the columns the suggestions show)
         xml_files = XMLFile.objects.filter(is_available=True)
         
         if query:
             # If user is typing, filter by DOI or title containing the query
             limit = min(batch_size, 50)  # Cap search results at 50
-            xml_files = xml_files.filter(
+            rows = xml_files.filter(
                 Q(doi__icontains=query) | 
                 Q(title__icontains=query)
-            ).order_by('doi')[:limit]
+            ).order_by('doi').values(*SUGGESTION_FIELDS)[:limit]
             
-            suggestions = []
-            for xml_file in xml_files:
-                suggestions.append(_format_xml_file_for_suggestion(xml_file))
+            suggestions = [_format_xml_file_for_suggestion(row) for row in rows]
             
             return JsonResponse({
                 'success': True,
@@ -1087,11 +1460,9 @@ def get_doi_suggestions(request):
                     }, status=400)
             
             # Get random papers for this year
-            random_files = year_files.order_by('?')[:batch_size]
+            random_files = _random_xml_files(year_files, batch_size, specific_year)
             
-            suggestions = []
-            for xml_file in random_files:
-                suggestions.append(_format_xml_file_for_suggestion(xml_file))
+            suggestions = [_format_xml_file_for_suggestion(row) for row in random_files]
             
             total_in_year = year_files.count()
             can_load_more = total_in_year > len(suggestions) and load_count < 3
@@ -1113,25 +1484,25 @@ def get_doi_suggestions(request):
             # Initial load: overview with 10 random suggestions from each year
             suggestions_by_year = {}
             
-            # Get available years (from publication_date)
-            years = XMLFile.objects.filter(
-                is_available=True,
-                publication_date__isnull=False
-            ).values_list(
-                'publication_date__year', flat=True
-            ).distinct().order_by('-publication_date__year')
+            # Count available files per publication year in one GROUP BY (None = no date)
+            year_counts = dict(
+                xml_files.annotate(
+                    year=ExtractYear('publication_date')
+                ).values('year').annotate(
+                    count=Count('id')
+                ).order_by().values_list('year', 'count')
+            )
+            years = sorted((year for year in year_counts if year is not None), reverse=True)
             
             total_suggestions = 0
             for year in years:
                 year_files = xml_files.filter(publication_date__year=year)
-                year_count = year_files.count()
+                year_count = year_counts[year]
                 
                 # Get random papers for overview (10 per year)
-                year_random = year_files.order_by('?')[:10]
+                year_random = _random_xml_files(year_files, 10, year)
                 
-                year_suggestions = []
-                for xml_file in year_random:
-                    year_suggestions.append(_format_xml_file_for_suggestion(xml_file))
+                year_suggestions = [_format_xml_file_for_suggestion(row) for row in year_random]
                 
                 if year_suggestions:
                     suggestions_by_year[str(year)] = {
@@ -1145,13 +1516,11 @@ def get_doi_suggestions(request):
             
             # Also get papers with no publication date
             no_date_files = xml_files.filter(publication_date__isnull=True)
-            no_date_count = no_date_files.count()
+            no_date_count = year_counts.get(None, 0)
             
             if no_date_count > 0:
-                no_date_random = no_date_files.order_by('?')[:10]
-                no_date_suggestions = []
-                for xml_file in no_date_random:
-                    no_date_suggestions.append(_format_xml_file_for_suggestion(xml_file))
+                no_date_random = _random_xml_files(no_date_files, 10, 'unknown')
+                no_date_suggestions = [_format_xml_file_for_suggestion(row) for row in no_date_random]
                 
                 suggestions_by_year['unknown'] = {
                     'year': 'Unknown',
@@ -1166,7 +1535,7 @@ def get_doi_suggestions(request):
                 'success': True,
                 'suggestions_by_year': suggestions_by_year,
                 'total_suggestions': total_suggestions,
-                'total_available': XMLFile.objects.filter(is_available=True).count(),
+                'total_available': sum(year_counts.values()),
                 'query': None,
                 'by_year': True,
                 'load_more': False
@@ -1196,11 +1565,8 @@ def check_doi_local_availability(request):
                 'error': 'No DOI provided'
             }, status=400)
         
-        # Initialize fetcher for DOI parsing
-        fetcher = BioRxivFetcher()
-        
         # Parse DOI from input (handles URLs and DOIs)
-        doi = fetcher.parse_biorxiv_identifier(doi_input)
+        doi = parse_doi_cached(doi_input)
         if not doi:
             return JsonResponse({
                 'success': False,
@@ -1213,18 +1579,8 @@ def check_doi_local_availability(request):
         
         if xml_file:
             # Verify file still exists on disk
-            if xml_file.verify_file_exists():
-                # Format authors for display
-                authors_display = "Unknown Authors"
-                if xml_file.authors:
-                    try:
-                        authors_list = json.loads(xml_file.authors)
-                        if len(authors_list) > 3:
-                            authors_display = f"{', '.join(authors_list[:3])} et al."
-                        else:
-                            authors_display = ', '.join(authors_list)
-                    except:
-                        authors_display = xml_file.authors[:50] + "..." if len(xml_file.authors) > 50 else xml_file.authors
+            if xml_file_exists_cached(xml_file):
+                authors_display = xml_file.get_authors_display()
                 
                 return JsonResponse({
                     'success': True,
@@ -1277,27 +1633,56 @@ def check_doi_local_availability(request):
         }, status=500)
 
 
-def _format_xml_file_for_suggestion(xml_file):
-    """Helper function to format XMLFile object for suggestion response"""
-    # Format authors for display
-    authors_display = "Unknown Authors"
-    if xml_file.authors:
-        try:
-            authors_list = json.loads(xml_file.authors)
-            if len(authors_list) > 3:
-                authors_display = f"{', '.join(authors_list[:3])} et al."
-            else:
-                authors_display = ', '.join(authors_list)
-        except:
-            authors_display = xml_file.authors[:50] + "..." if len(xml_file.authors) > 50 else xml_file.authors
+# Columns fetched (as plain dicts) for _format_xml_file_for_suggestion; authors is only
+# read for rows saved before authors_display existed
+SUGGESTION_FIELDS = ('id', 'doi', 'title', 'authors', 'authors_display', 'publication_date', 'file_size', 'downloaded_at')
+
+# id bounds per year only shift when files are downloaded, so a day-old range is fine
+SUGGESTION_BOUNDS_CACHE_TIMEOUT = 86400
+
+
+def _random_xml_files(year_files, size, partition):
+    """
+    Pick ~size random rows (SUGGESTION_FIELDS dicts) from a year's XML files without ORDER BY RANDOM().
     
+    Random ids are drawn in Python from the partition's (cached) id range and fetched
+    with an indexed id__in lookup; if gaps in the id range leave the sample short, it is
+    topped up with a keyset slice starting at a random id.
+    """
+    bounds = cache.get_or_set(
+        f"doi_suggest_bounds:{partition}",
+        lambda: year_files.aggregate(lo=Min('id'), hi=Max('id')),
+        SUGGESTION_BOUNDS_CACHE_TIMEOUT
+    )
+    lo, hi = bounds['lo'], bounds['hi']
+    if lo is None:
+        return []
+    
+    candidate_ids = random.sample(range(lo, hi + 1), min(hi - lo + 1, size * 3))
+    rows = year_files.values(*SUGGESTION_FIELDS)
+    picked = list(rows.filter(id__in=candidate_ids).order_by()[:size])
+    
+    if len(picked) < size:
+        rest = rows.exclude(id__in=[row['id'] for row in picked]).order_by('id')
+        pivot = random.randint(lo, hi)
+        picked += rest.filter(id__gte=pivot)[:size - len(picked)]
+        if len(picked) < size:
+            picked += rest.filter(id__lt=pivot)[:size - len(picked)]
+    
+    random.shuffle(picked)
+    return picked
+
+
+def _format_xml_file_for_suggestion(row):
+    """Helper function to format an XMLFile values() row for suggestion response"""
+    title = row['title']
     return {
-        'doi': xml_file.doi,
-        'title': xml_file.title[:80] + "..." if xml_file.title and len(xml_file.title) > 80 else xml_file.title or "Unknown Title",
-        'authors': authors_display,
-        'publication_date': xml_file.publication_date.strftime('%Y-%m-%d') if xml_file.publication_date else 'Unknown Date',
-        'file_size': xml_file.file_size,
-        'downloaded_at': xml_file.downloaded_at.strftime('%Y-%m-%d') if xml_file.downloaded_at else None
+        'doi': row['doi'],
+        'title': title[:80] + "..." if title and len(title) > 80 else title or "Unknown Title",
+        'authors': row['authors_display'] or XMLFile.format_authors_display(row['authors']),
+        'publication_date': row['publication_date'].strftime('%Y-%m-%d') if row['publication_date'] else 'Unknown Date',
+        'file_size': row['file_size'],
+        'downloaded_at': row['downloaded_at'].strftime('%Y-%m-%d') if row['downloaded_at'] else None
     }
 
 
@@ -1305,24 +1690,30 @@ class AboutView(TemplateView):
     """About page with information about KRT Maker"""
     template_name = 'web/about.html'
     
+    # About page counters don't need to be live
+    STATS_CACHE_TIMEOUT = 300
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Add some statistics for the about page
-        from .models import KRTSession, Article, XMLFile
+        context['stats'] = cache.get_or_set(KRTSession.ABOUT_STATS_CACHE_KEY, self._compute_stats, self.STATS_CACHE_TIMEOUT)
+        return context
+    
+    @staticmethod
+    def _compute_stats():
+        completed = Q(status='completed')
+        session_stats = KRTSession.objects.aggregate(
+            processed=Count('id', filter=completed),
+            avg_time=Avg('processing_time', filter=completed & Q(processing_time__isnull=False)),
+        )
         
-        stats = {
-            'total_papers_processed': KRTSession.objects.filter(status='completed').count(),
+        return {
+            'total_papers_processed': session_stats['processed'],
             'total_papers_available': XMLFile.objects.filter(is_available=True).count(),
             'total_articles': Article.objects.count(),
-            'avg_processing_time': KRTSession.objects.filter(
-                status='completed', 
-                processing_time__isnull=False
-            ).aggregate(avg_time=models.Avg('processing_time'))['avg_time'] or 0,
+            'avg_processing_time': session_stats['avg_time'] or 0,
         }
-        
-        context['stats'] = stats
-        return context
 
 
 class APIDocsView(TemplateView):
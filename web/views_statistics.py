@@ -18,6 +18,10 @@ class StatisticsView(TemplateView):
     """Comprehensive statistics page for research resource analysis"""
     template_name = 'web/statistics.html'
     
+    # The analyses below make a single pass over every completed session; stream the rows
+    # in chunks instead of letting the queryset cache hold them all
+    ITERATOR_CHUNK_SIZE = 2000
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
@@ -50,7 +54,7 @@ class StatisticsView(TemplateView):
             'total_sessions': KRTSession.objects.count(),
             'completed_sessions': completed_sessions.count(),
             'total_articles': total_articles,
-            'total_resources_extracted': sum(s.resources_found for s in completed_sessions),
+            'total_resources_extracted': completed_sessions.aggregate(total=Sum('resources_found'))['total'] or 0,
             'avg_resources_per_paper': completed_sessions.aggregate(Avg('resources_found'))['resources_found__avg'] or 0,
             'avg_processing_time': completed_sessions.aggregate(Avg('processing_time'))['processing_time__avg'] or 0,
             'bioRxiv_papers': completed_sessions.filter(input_method='url').count(),
@@ -85,7 +89,7 @@ class StatisticsView(TemplateView):
         academic_count = 0
         other_sources_count = 0
         
-        for session in completed_sessions:
+        for session in completed_sessions.only('krt_data').iterator(chunk_size=self.ITERATOR_CHUNK_SIZE):
             if session.krt_data:
                 for resource in session.krt_data:
                     # Resource type analysis
@@ -198,7 +202,7 @@ class StatisticsView(TemplateView):
             'developmental': ['develop', 'embryo', 'stem cell', 'differentiat']
         }
         
-        for session in completed_sessions:
+        for session in completed_sessions.only('keywords', 'krt_data').iterator(chunk_size=self.ITERATOR_CHUNK_SIZE):
             if session.keywords:
                 try:
                     keywords = json.loads(session.keywords) if isinstance(session.keywords, str) else session.keywords
@@ -249,7 +253,7 @@ class StatisticsView(TemplateView):
         total_software = 0
         protocols_referenced = 0
         
-        for session in completed_sessions:
+        for session in completed_sessions.only('krt_data').iterator(chunk_size=self.ITERATOR_CHUNK_SIZE):
             if session.krt_data:
                 for resource in session.krt_data:
                     total_resources += 1